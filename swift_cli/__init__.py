@@ -20,11 +20,35 @@ Example usage:
 __version__ = "1.0.0"
 __author__ = "Livinus Tuyisenge"
 
+import importlib
+
 from .bic_validator import BICCode, validate_bic
 from .iban_validator import IBAN, validate_iban
-from .iso20022_generator import ISO20022Generator, PaymentInstruction, PaymentBatch
 from .mt103_generator import MT103Message, Party
 
+# Chargement différé (PEP 562) : le générateur ISO 20022 et sa bibliothèque XML
+# ne sont importés qu'au premier accès à l'un de ces noms
+_LAZY_ATTRS = {
+    "ISO20022Generator": ".iso20022_generator",
+    "PaymentInstruction": ".iso20022_generator",
+    "PaymentBatch": ".iso20022_generator",
+    "PaymentBatchSoA": ".iso20022_generator",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
+
 __all__ = [
     "BICCode",
     "validate_bic",
@@ -33,6 +57,7 @@ __all__ = [
     "ISO20022Generator",
     "PaymentInstruction",
     "PaymentBatch",
+    "PaymentBatchSoA",
     "MT103Message",
     "Party",
 ]
@@ -4,10 +4,26 @@ BIC/SWIFT Code Validator
 Validation et parsing des codes BIC (Bank Identifier Code)
 """
 
-import re
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Optional
 
+# Noms des pays (ISO 3166), table en lecture seule construite une seule fois
+_COUNTRY_NAMES = MappingProxyType({
+    "FR": "France",
+    "DE": "Allemagne",
+    "GB": "Royaume-Uni",
+    "US": "États-Unis",
+    "ES": "Espagne",
+    "IT": "Italie",
+    "BE": "Belgique",
+    "NL": "Pays-Bas",
+    "CH": "Suisse",
+    "LU": "Luxembourg",
+    "AT": "Autriche",
+    "PT": "Portugal",
+})
+
 
 @dataclass
 class BICCode:
@@ -49,17 +65,16 @@ class BICCode:
                 f"Le code BIC doit contenir 8 ou 11 caractères, reçu {len(bic)}"
             )
         
-        pattern = r'^([A-Z]{4})([A-Z]{2})([A-Z0-9]{2})([A-Z0-9]{3})?$'
-        match = re.match(pattern, bic)
-        
-        if not match:
+        # Format : 4 lettres (banque) + 2 lettres (pays), puis alphanumériques
+        # (localisation + agence). isascii() écarte les lettres accentuées.
+        if not (bic.isascii() and bic[:6].isalpha() and bic[6:].isalnum()):
             raise ValueError(f"Format BIC invalide: {bic}")
         
         return cls(
-            bank_code=match.group(1),
-            country_code=match.group(2),
-            location_code=match.group(3),
-            branch_code=match.group(4)
+            bank_code=bic[:4],
+            country_code=bic[4:6],
+            location_code=bic[6:8],
+            branch_code=bic[8:] or None
         )
     
     def validate(self) -> bool:
@@ -69,29 +84,18 @@ class BICCode:
         Returns:
             bool: True si le format est valide
         """
-        try:
-            BICCode.parse(self.full_code)
-            return True
-        except ValueError:
-            return False
+        # Mêmes règles que parse(), appliquées directement aux champs
+        return (
+            len(self.bank_code) == 4 and self.bank_code.isascii() and self.bank_code.isalpha()
+            and len(self.country_code) == 2 and self.country_code.isascii() and self.country_code.isalpha()
+            and len(self.location_code) == 2 and self.location_code.isascii() and self.location_code.isalnum()
+            and (not self.branch_code
+                 or (len(self.branch_code) == 3 and self.branch_code.isascii() and self.branch_code.isalnum()))
+        )
     
     def get_country_name(self) -> str:
         """Retourne le nom du pays basé sur le code ISO"""
-        countries = {
-            "FR": "France",
-            "DE": "Allemagne", 
-            "GB": "Royaume-Uni",
-            "US": "États-Unis",
-            "ES": "Espagne",
-            "IT": "Italie",
-            "BE": "Belgique",
-            "NL": "Pays-Bas",
-            "CH": "Suisse",
-            "LU": "Luxembourg",
-            "AT": "Autriche",
-            "PT": "Portugal",
-        }
-        return countries.get(self.country_code, "Inconnu")
+        return _COUNTRY_NAMES.get(self.country_code, "Inconnu")
     
     def __str__(self) -> str:
         return self.full_code
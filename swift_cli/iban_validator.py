@@ -4,9 +4,12 @@ IBAN Validator
 Validation des numéros IBAN selon la norme ISO 13616
 """
 
+from __future__ import annotations
+
 import re
-from dataclasses import dataclass
-from typing import Dict, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
 # Longueurs IBAN par pays (ISO 13616)
 IBAN_LENGTHS: Dict[str, int] = {
@@ -58,43 +61,78 @@ COUNTRY_NAMES: Dict[str, str] = {
     "SE": "Suède", "SI": "Slovénie", "SK": "Slovaquie",
 }
 
+# Format de base : 2 lettres (pays) + 2 chiffres (clé) + BBAN alphanumérique
+_IBAN_FORMAT_RE = re.compile(r'^[A-Z]{2}[0-9]{2}[A-Z0-9]+$')
+
+# Conversion des lettres en chiffres pour le MOD-97 (A=10, B=11, ..., Z=35).
+# Table indexée par code ASCII plutôt qu'un dict de str.maketrans : translate
+# y accède par index, sans hachage ; hors ASCII (IndexError), le caractère
+# est laissé tel quel comme avec str.maketrans.
+_IBAN_TRANS = tuple(str(c - 55) if 65 <= c <= 90 else chr(c) for c in range(128))
+
+
+def _mod97(value: str) -> int:
+    """
+    Reste MOD-97 (ISO 7064) d'une chaîne alphanumérique majuscule
+    
+    Les lettres sont converties en chiffres (A=10, B=11, ..., Z=35) puis le
+    nombre obtenu est réduit modulo 97. int() + % en C reste plus rapide en
+    CPython qu'un reste accumulé caractère par caractère en Python (au plus
+    ~70 chiffres) ; le calcul accumulé est celui du noyau compilé de
+    iban_validator_jit.
+    """
+    return int(value.translate(_IBAN_TRANS)) % 97
 
-@dataclass
+
+@dataclass(slots=True)
 class IBAN:
     """Représentation et validation d'un numéro IBAN"""
     raw_iban: str
     
+    # Découpage calculé une fois à la création (voir __post_init__)
+    _country: str = field(init=False, repr=False, compare=False)
+    _check: str = field(init=False, repr=False, compare=False)
+    _bban: str = field(init=False, repr=False, compare=False)
+    _country_name: str = field(init=False, repr=False, compare=False)
+    _formatted: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
     def __post_init__(self):
-        """Nettoie l'IBAN à la création"""
-        self.raw_iban = self.raw_iban.replace(" ", "").upper()
+        """Nettoie l'IBAN et le découpe une fois à la création"""
+        # Sans condition : tester isupper() avant upper() coûte plus en
+        # bytecode que la copie d'une trentaine de caractères
+        self.raw_iban = iban = self.raw_iban.replace(" ", "").upper()
+        self._country = iban[:2]
+        self._check = iban[2:4]
+        self._bban = iban[4:]
+        self._country_name = COUNTRY_NAMES.get(self._country, "Inconnu")
     
     @property
     def formatted(self) -> str:
-        """IBAN formaté avec espaces tous les 4 caractères"""
-        return " ".join(
-            self.raw_iban[i:i+4] 
-            for i in range(0, len(self.raw_iban), 4)
-        )
+        """IBAN formaté avec espaces tous les 4 caractères (calculé au premier accès)"""
+        if self._formatted is None:
+            iban = self.raw_iban
+            self._formatted = " ".join([iban[i:i+4] for i in range(0, len(iban), 4)])
+        return self._formatted
     
     @property
     def country_code(self) -> str:
         """Code pays (2 premières lettres)"""
-        return self.raw_iban[:2]
+        return self._country
     
     @property
     def check_digits(self) -> str:
         """Chiffres de contrôle (positions 3-4)"""
-        return self.raw_iban[2:4]
+        return self._check
     
     @property
     def bban(self) -> str:
         """Basic Bank Account Number (après les 4 premiers caractères)"""
-        return self.raw_iban[4:]
+        return self._bban
     
     @property
     def country_name(self) -> str:
         """Nom du pays"""
-        return COUNTRY_NAMES.get(self.country_code, "Inconnu")
+        return self._country_name
     
     def validate(self) -> Tuple[bool, str]:
         """
@@ -105,45 +143,56 @@ class IBAN:
         """
         iban = self.raw_iban
         
-        # Vérification du format de base
-        if not re.match(r'^[A-Z]{2}[0-9]{2}[A-Z0-9]+$', iban):
-            return False, "Format IBAN invalide (doit commencer par 2 lettres + 2 chiffres)"
-        
         # Vérification de la longueur minimale
-        if len(iban) < 15:
-            return False, f"IBAN trop court: {len(iban)} caractères (minimum 15)"
+        length = len(iban)
+        if length < 15:
+            return False, f"IBAN trop court: {length} caractères (minimum 15)"
         
         # Vérification de la longueur par pays
-        country = iban[:2]
-        if country in IBAN_LENGTHS:
-            expected_length = IBAN_LENGTHS[country]
-            if len(iban) != expected_length:
-                return False, (
-                    f"Longueur incorrecte pour {country} ({self.country_name}): "
-                    f"attendu {expected_length}, reçu {len(iban)}"
-                )
-        else:
-            # Pays non reconnu, vérification basique uniquement
-            pass
-        
-        # Algorithme de validation MOD-97 (ISO 7064)
-        # Étape 1: Réorganiser (déplacer les 4 premiers caractères à la fin)
-        rearranged = iban[4:] + iban[:4]
+        # (pays non reconnu : vérification basique uniquement)
+        country = self._country
+        expected_length = IBAN_LENGTHS.get(country)
+        if expected_length is not None and length != expected_length:
+            return False, (
+                f"Longueur incorrecte pour {country} ({self._country_name}): "
+                f"attendu {expected_length}, reçu {length}"
+            )
         
-        # Étape 2: Conversion des lettres en chiffres (A=10, B=11, ..., Z=35)
-        numeric = ""
-        for char in rearranged:
-            if char.isalpha():
-                numeric += str(ord(char) - ord('A') + 10)
-            else:
-                numeric += char
+        # Vérification du format de base (après les longueurs, contrôles moins coûteux).
+        # Cas courant testé sur les découpes de __post_init__ ; la regex ne
+        # tranche que les IBAN qui échouent à ces prédicats.
+        well_formed = iban.isascii() and self._country.isalpha() and self._check.isdigit() and self._bban.isalnum()
+        if not well_formed and not _IBAN_FORMAT_RE.match(iban):
+            return False, "Format IBAN invalide (doit commencer par 2 lettres + 2 chiffres)"
         
-        # Étape 3: Vérification MOD 97
-        remainder = int(numeric) % 97
+        # Algorithme de validation MOD-97 (ISO 7064)
+        # Réorganiser (déplacer les 4 premiers caractères à la fin), puis MOD 97
+        remainder = _mod97(self._bban + iban[:4])
         if remainder != 1:
             return False, f"Clé de contrôle IBAN invalide (reste: {remainder}, attendu: 1)"
         
-        return True, f"IBAN valide ({self.country_name})"
+        return True, f"IBAN valide ({self._country_name})"
+    
+    def is_valid(self) -> bool:
+        """
+        Mêmes contrôles que validate(), sans construire de message
+        
+        Pour les appelants qui n'utilisent que le verdict (filtrage, tri).
+        
+        Returns:
+            bool: True si l'IBAN est valide
+        """
+        iban = self.raw_iban
+        length = len(iban)
+        if length < 15:
+            return False
+        expected_length = IBAN_LENGTHS.get(self._country)
+        if expected_length is not None and length != expected_length:
+            return False
+        well_formed = iban.isascii() and self._country.isalpha() and self._check.isdigit() and self._bban.isalnum()
+        if not well_formed and not _IBAN_FORMAT_RE.match(iban):
+            return False
+        return _mod97(self._bban + iban[:4]) == 1
     
     @classmethod
     def generate_check_digits(cls, country_code: str, bban: str) -> str:
@@ -160,16 +209,8 @@ class IBAN:
         # Construction de l'IBAN temporaire avec "00" comme clé
         temp_iban = bban + country_code + "00"
         
-        # Conversion en numérique
-        numeric = ""
-        for char in temp_iban.upper():
-            if char.isalpha():
-                numeric += str(ord(char) - ord('A') + 10)
-            else:
-                numeric += char
-        
         # Calcul de la clé
-        check = 98 - (int(numeric) % 97)
+        check = 98 - _mod97(temp_iban.upper())
         return f"{check:02d}"
     
     @classmethod
@@ -194,18 +235,27 @@ class IBAN:
         return f"IBAN('{self.raw_iban}')"
 
 
+@lru_cache(maxsize=4096)
+def _validate_normalized(iban_str: str) -> Tuple[bool, str]:
+    """Valide un IBAN déjà normalisé (résultat mis en cache)"""
+    return IBAN(iban_str).validate()
+
+
 def validate_iban(iban_str: str) -> Tuple[bool, str]:
     """
     Fonction utilitaire pour valider un IBAN
     
+    Les IBAN qui reviennent (contreparties connues d'un rapprochement) sont
+    servis par un cache, indexé sur la forme normalisée : "FR76 3000 ..." et
+    "fr763000..." partagent la même entrée.
+    
     Args:
         iban_str: Chaîne IBAN à valider
         
     Returns:
         tuple: (is_valid, message)
     """
-    iban = IBAN(iban_str)
-    return iban.validate()
+    return _validate_normalized(iban_str.replace(" ", "").upper())
 
 
 if __name__ == "__main__":
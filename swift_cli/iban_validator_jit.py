@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+IBAN Validator - validation par lot
+Validation vectorisée de grands volumes d'IBAN (NumPy + Numba)
+
+Nécessite NumPy. Numba est optionnel : sans lui, le même contrôle est
+vectorisé colonne par colonne avec NumPy.
+"""
+
+from typing import Iterator, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Remplaçant sans effet de numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+try:
+    # When installed as a package
+    from swift_cli.iban_validator import COUNTRY_NAMES, IBAN_LENGTHS, validate_iban
+except ImportError:
+    # When running directly
+    from iban_validator import COUNTRY_NAMES, IBAN_LENGTHS, validate_iban
+
+
+# Longueur maximale d'un IBAN (ISO 13616)
+IBAN_WIDTH = 34
+
+# Nombre d'IBAN traités ensemble par le chemin NumPy (sans Numba)
+COLUMN_BLOCK_ROWS = 65536
+
+# Longueur attendue par pays, indexée par (lettre1 - 'A') * 26 + (lettre2 - 'A') ; 0 = pays inconnu
+COUNTRY_LENGTHS = np.zeros(26 * 26, dtype=np.uint8)
+for _country, _length in IBAN_LENGTHS.items():
+    COUNTRY_LENGTHS[(ord(_country[0]) - 65) * 26 + ord(_country[1]) - 65] = _length
+del _country, _length
+
+# Message de validate_iban pour un IBAN valide, par code pays
+_VALID_MESSAGES = {country: f"IBAN valide ({name})" for country, name in COUNTRY_NAMES.items()}
+_VALID_UNKNOWN = "IBAN valide (Inconnu)"
+
+
+@njit
+def _iban_validate_kernel(buf, lengths, country_lengths):
+    """Vérifie format, longueur et clé MOD-97 de chaque ligne de `buf` (uint8[N, 34])"""
+    n = buf.shape[0]
+    out = np.zeros(n, dtype=np.bool_)
+    for i in range(n):
+        length = int(lengths[i])
+        if length < 15:
+            continue
+        # 2 lettres (pays) + 2 chiffres (clé)
+        c0 = int(buf[i, 0])
+        c1 = int(buf[i, 1])
+        if not (65 <= c0 <= 90 and 65 <= c1 <= 90 and 48 <= buf[i, 2] <= 57 and 48 <= buf[i, 3] <= 57):
+            continue
+        expected = int(country_lengths[(c0 - 65) * 26 + (c1 - 65)])
+        if expected != 0 and expected != length:
+            continue
+        # MOD-97 sur l'IBAN réorganisé (4 premiers caractères en fin), lettres A=10..Z=35
+        acc = 0
+        ok = True
+        for k in range(length):
+            c = int(buf[i, k + 4] if k < length - 4 else buf[i, k - length + 4])
+            if 48 <= c <= 57:
+                acc = (acc * 10 + c - 48) % 97
+            elif 65 <= c <= 90:
+                acc = (acc * 100 + c - 55) % 97
+            else:
+                ok = False
+                break
+        out[i] = ok and acc == 1
+    return out
+
+
+def _iban_validate_columns(buf, lengths):
+    """
+    Même contrôle que _iban_validate_kernel, vectorisé avec NumPy (sans Numba)
+
+    Les N IBAN avancent ensemble : la clé MOD-97 est calculée colonne par
+    colonne (34 itérations Python au plus) sur le lot entier.
+    """
+    size = lengths.astype(np.intp)
+    upper = (buf >= 65) & (buf <= 90)
+    digit = (buf >= 48) & (buf <= 57)
+    positions = np.arange(IBAN_WIDTH)
+    inside = positions < size[:, None]
+
+    ok = (size >= 15) & upper[:, 0] & upper[:, 1] & digit[:, 2] & digit[:, 3]
+    ok &= ~(inside & ~(upper | digit)).any(axis=1)
+    country = (buf[:, 0].astype(np.intp) - 65).clip(0, 25) * 26 + (buf[:, 1].astype(np.intp) - 65).clip(0, 25)
+    expected = COUNTRY_LENGTHS[country]
+    ok &= (expected == 0) | (expected == size)
+
+    # IBAN réorganisé : rotated[i, k] = buf[i, (k + 4) % longueur]
+    rotated = np.take_along_axis(buf, (positions + 4) % np.maximum(size, 1)[:, None], axis=1).astype(np.int64)
+    acc = np.zeros(len(size), dtype=np.int64)
+    for k in range(IBAN_WIDTH):
+        char = rotated[:, k]
+        step = np.where(char >= 65, (acc * 100 + char - 55) % 97, (acc * 10 + char - 48) % 97)
+        acc = np.where(inside[:, k], step, acc)
+    return ok & (acc == 1)
+
+
+def validate_iban_batch(codes: Sequence[str]) -> np.ndarray:
+    """
+    Valide une liste d'IBAN en un seul passage compilé
+
+    Les IBAN sont normalisés comme dans IBAN (espaces retirés, majuscules)
+    puis empaquetés dans un tableau uint8 de N lignes x 34 octets, validé
+    par le noyau Numba ou, sans Numba, par les opérations NumPy en colonnes.
+
+    Args:
+        codes: IBAN à valider
+
+    Returns:
+        np.ndarray: Tableau de booléens (True si l'IBAN est valide)
+    """
+    padded = []
+    lengths = np.zeros(len(codes), dtype=np.uint8)
+    for idx, code in enumerate(codes):
+        code = code.replace(" ", "").upper()
+        if code.isascii() and len(code) <= IBAN_WIDTH:
+            lengths[idx] = len(code)
+            padded.append(code.ljust(IBAN_WIDTH))
+        else:
+            padded.append(" " * IBAN_WIDTH)
+
+    buf = np.frombuffer("".join(padded).encode("ascii"), dtype=np.uint8).reshape(-1, IBAN_WIDTH)
+    if HAS_NUMBA:
+        return _iban_validate_kernel(buf, lengths, COUNTRY_LENGTHS)
+    # Par blocs : les tableaux intermédiaires restent bornés quel que soit N
+    out = np.zeros(len(codes), dtype=np.bool_)
+    for start in range(0, len(codes), COLUMN_BLOCK_ROWS):
+        stop = start + COLUMN_BLOCK_ROWS
+        out[start:stop] = _iban_validate_columns(buf[start:stop], lengths[start:stop])
+    return out
+
+
+def validate_iban_many(codes: Sequence[str]) -> Iterator[Tuple[bool, str]]:
+    """
+    Produit pour chaque IBAN le même résultat que validate_iban
+
+    Le noyau compilé tranche pour tout le lot ; seuls les IBAN rejetés
+    repassent par validate_iban pour obtenir le message d'erreur détaillé.
+    """
+    valid_message = _VALID_MESSAGES.get
+    for code, ok in zip(codes, validate_iban_batch(codes)):
+        if ok:
+            country = code.replace(" ", "").upper()[:2]
+            yield True, valid_message(country, _VALID_UNKNOWN)
+        else:
+            yield validate_iban(code)
@@ -4,15 +4,60 @@ ISO 20022 Message Generator
 Génération de messages pain.001 (Customer Credit Transfer Initiation)
 """
 
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
-import uuid
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import copy
+import functools
+import itertools
+import math
+import os
 
+try:
+    # lxml (optionnel) : sérialisation et indentation en C
+    import lxml.etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
 
-@dataclass
+# Caractères qu'un texte XML doit échapper
+_XML_SPECIAL_CHARS = frozenset('&<>"')
+
+
+def _reset_end_to_end_ids() -> None:
+    """
+    Tire un nouveau préfixe EndToEndId et remet le compteur à zéro
+    
+    Identifiants générés : préfixe aléatoire propre au processus + compteur
+    hexadécimal (24 + 1 + 10 = 35 caractères, la longueur maximale ISO).
+    Appelé à l'import puis dans chaque processus enfant après os.fork(),
+    qui hériterait sinon du préfixe et du compteur du parent.
+    """
+    global _E2E_PREFIX, _e2e_counter
+    _E2E_PREFIX = os.urandom(12).hex()
+    _e2e_counter = itertools.count()
+
+
+_reset_end_to_end_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_end_to_end_ids)
+
+
+@functools.lru_cache(maxsize=65536)
+def _format_cached_amount(amount: float) -> str:
+    """Formate un montant non nul avec 2 décimales (mémorisé : les montants se répètent d'un lot à l'autre)"""
+    return f"{amount:.2f}"
+
+
+def _format_amount(amount: float) -> str:
+    """Formate un montant avec 2 décimales"""
+    # 0.0 et -0.0 sont la même clé de cache mais ne s'affichent pas pareil
+    return _format_cached_amount(amount) if amount else f"{amount:.2f}"
+
+
+@dataclass(slots=True)
 class Address:
     """Adresse postale"""
     street: Optional[str] = None
@@ -22,7 +67,7 @@ class Address:
     country: str = "FR"
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentInstruction:
     """Instruction de paiement individuelle"""
     instruction_id: str
@@ -41,10 +86,10 @@ class PaymentInstruction:
     
     def __post_init__(self):
         if self.end_to_end_id is None:
-            self.end_to_end_id = str(uuid.uuid4())[:35]
+            self.end_to_end_id = f"{_E2E_PREFIX}-{next(_e2e_counter):010x}"
 
 
-@dataclass
+@dataclass(slots=True)
 class PaymentBatch:
     """Lot de paiements"""
     payment_info_id: str
@@ -60,7 +105,66 @@ class PaymentBatch:
     
     @property
     def total_amount(self) -> float:
-        return sum(p.amount for p in self.payments)
+        return math.fsum(p.amount for p in self.payments)
+    
+    @property
+    def transaction_count(self) -> int:
+        return len(self.payments)
+
+
+@dataclass(slots=True)
+class PaymentBatchSoA:
+    """
+    Lot de paiements à stockage en colonnes (Struct-of-Arrays)
+    
+    Les montants sont tenus dans une colonne `amounts` parallèle aux
+    instructions : le CtrlSum parcourt un array('d') contigu au lieu des
+    objets, et la colonne est lisible sans copie par NumPy
+    (numpy.frombuffer(batch.amounts)).
+    
+    Utilisable partout où un PaymentBatch est attendu. Les instructions sont
+    un tuple : elles ne s'ajoutent que par add() ou extend(), ce qui garde
+    la colonne synchronisée avec ce qui est sérialisé.
+    """
+    payment_info_id: str
+    payment_method: str = "TRF"  # TRF = Transfer
+    batch_booking: bool = True
+    service_level: str = "SEPA"
+    requested_execution_date: Optional[datetime] = None
+    payments: Tuple[PaymentInstruction, ...] = ()
+    amounts: array = field(default_factory=lambda: array("d"), init=False)
+    
+    def __post_init__(self):
+        if self.requested_execution_date is None:
+            self.requested_execution_date = datetime.utcnow()
+        payments, self.payments = self.payments, ()
+        self.extend(payments)
+    
+    @classmethod
+    def from_batch(cls, batch: PaymentBatch) -> "PaymentBatchSoA":
+        """Convertit un PaymentBatch en lot à colonnes"""
+        return cls(
+            payment_info_id=batch.payment_info_id,
+            payment_method=batch.payment_method,
+            batch_booking=batch.batch_booking,
+            service_level=batch.service_level,
+            requested_execution_date=batch.requested_execution_date,
+            payments=batch.payments,
+        )
+    
+    def add(self, payment: PaymentInstruction) -> None:
+        """Ajoute un paiement au lot et à la colonne des montants"""
+        self.extend((payment,))
+    
+    def extend(self, payments: Iterable[PaymentInstruction]) -> None:
+        """Ajoute plusieurs paiements au lot (un seul nouveau tuple par appel)"""
+        payments = tuple(payments)
+        self.payments += payments
+        self.amounts.extend(p.amount for p in payments)
+    
+    @property
+    def total_amount(self) -> float:
+        return math.fsum(self.amounts)
     
     @property
     def transaction_count(self) -> int:
@@ -76,16 +180,47 @@ class ISO20022Generator:
     # Namespace pour pain.001.001.09
     NAMESPACE = "urn:iso:std:iso:20022:tech:xsd:pain.001.001.09"
     
+    # Nombre maximal de fragments XML constants (InitgPty, bloc débiteur) mémorisés
+    FRAGMENT_CACHE_SIZE = 256
+    
     def __init__(self):
         self.ns = {"": self.NAMESPACE}
+        self._fragment_cache: Dict[Tuple, List[ET.Element]] = {}
     
-    def _create_element(self, parent: ET.Element, tag: str, text: Optional[str] = None) -> ET.Element:
-        """Crée un élément XML avec texte optionnel"""
-        elem = ET.SubElement(parent, tag)
+    def _create_element(self, parent: ET.Element, tag: str, text: Optional[str] = None, **attrs: str) -> ET.Element:
+        """Crée un élément XML (texte et attributs optionnels) directement sous son parent"""
+        elem = ET.SubElement(parent, tag, **attrs)
         if text is not None:
             elem.text = str(text)
         return elem
     
+    def _create_ascii_element(self, parent: ET.Element, tag: str, text: str) -> ET.Element:
+        """
+        Crée un élément dont le texte est déjà une chaîne ASCII sans caractère à échapper
+        
+        Réservé aux codes (BIC, IBAN, pays, devise, méthode, niveau de
+        service) et aux valeurs produites ici (dates, montants, compteurs) :
+        le texte est affecté tel quel, sans conversion par str().
+        """
+        assert isinstance(text, str) and text.isascii() and _XML_SPECIAL_CHARS.isdisjoint(text), text
+        elem = ET.SubElement(parent, tag)
+        elem.text = text
+        return elem
+    
+    def _cached_fragments(self, key: Tuple, build: Callable[[], List[ET.Element]]) -> List[ET.Element]:
+        """
+        Retourne une copie de fragments XML constants, construits une seule fois
+        
+        Un même initiateur ou un même débiteur se retrouve d'un message à
+        l'autre : le fragment est construit au premier usage puis copié.
+        """
+        template = self._fragment_cache.get(key)
+        if template is None:
+            if len(self._fragment_cache) >= self.FRAGMENT_CACHE_SIZE:
+                self._fragment_cache.clear()
+            template = self._fragment_cache[key] = build()
+        return [copy.deepcopy(elem) for elem in template]
+    
     def _add_address(self, parent: ET.Element, address: Address) -> None:
         """Ajoute une adresse postale"""
         pstl_adr = self._create_element(parent, "PstlAdr")
@@ -97,7 +232,135 @@ class ISO20022Generator:
             self._create_element(pstl_adr, "PstCd", address.postal_code)
         if address.city:
             self._create_element(pstl_adr, "TwnNm", address.city)
-        self._create_element(pstl_adr, "Ctry", address.country)
+        self._create_ascii_element(pstl_adr, "Ctry", address.country)
+    
+    def _fill_group_header(
+        self,
+        grp_hdr: ET.Element,
+        message_id: str,
+        initiating_party_name: str,
+        batches: List[PaymentBatch],
+        initiating_party_id: Optional[str] = None,
+    ) -> None:
+        """Remplit l'en-tête de groupe (GrpHdr)"""
+        # Calcul des totaux
+        total_transactions = sum(b.transaction_count for b in batches)
+        total_amount = math.fsum(b.total_amount for b in batches)
+        
+        self._create_element(grp_hdr, "MsgId", message_id)
+        self._create_ascii_element(grp_hdr, "CreDtTm", datetime.utcnow().isoformat())
+        self._create_ascii_element(grp_hdr, "NbOfTxs", str(total_transactions))
+        self._create_ascii_element(grp_hdr, "CtrlSum", _format_amount(total_amount))
+        
+        # Initiating Party
+        grp_hdr.extend(self._cached_fragments(
+            ("InitgPty", initiating_party_name, initiating_party_id),
+            lambda: self._build_initiating_party(initiating_party_name, initiating_party_id),
+        ))
+    
+    def _build_initiating_party(self, name: str, party_id: Optional[str]) -> List[ET.Element]:
+        """Construit le fragment InitgPty"""
+        initg_pty = ET.Element("InitgPty")
+        self._create_element(initg_pty, "Nm", name)
+        
+        if party_id:
+            initg_pty_id = self._create_element(initg_pty, "Id")
+            org_id = self._create_element(initg_pty_id, "OrgId")
+            othr = self._create_element(org_id, "Othr")
+            self._create_element(othr, "Id", party_id)
+        return [initg_pty]
+    
+    def _build_debtor(self, payment: PaymentInstruction) -> List[ET.Element]:
+        """Construit les fragments Dbtr, DbtrAcct et DbtrAgt"""
+        # Debtor
+        dbtr = ET.Element("Dbtr")
+        self._create_element(dbtr, "Nm", payment.debtor_name)
+        if payment.debtor_address:
+            self._add_address(dbtr, payment.debtor_address)
+        
+        # Debtor Account
+        dbtr_acct = ET.Element("DbtrAcct")
+        dbtr_acct_id = self._create_element(dbtr_acct, "Id")
+        self._create_ascii_element(dbtr_acct_id, "IBAN", payment.debtor_iban)
+        
+        # Debtor Agent
+        dbtr_agt = ET.Element("DbtrAgt")
+        fin_instn_id = self._create_element(dbtr_agt, "FinInstnId")
+        self._create_ascii_element(fin_instn_id, "BICFI", payment.debtor_bic)
+        return [dbtr, dbtr_acct, dbtr_agt]
+    
+    def _fill_payment_info(self, pmt_inf: ET.Element, batch: PaymentBatch) -> None:
+        """Remplit l'en-tête d'un lot (PmtInf), hors transactions"""
+        self._create_element(pmt_inf, "PmtInfId", batch.payment_info_id)
+        self._create_ascii_element(pmt_inf, "PmtMtd", batch.payment_method)
+        self._create_ascii_element(pmt_inf, "BtchBookg", str(batch.batch_booking).lower())
+        self._create_ascii_element(pmt_inf, "NbOfTxs", str(batch.transaction_count))
+        self._create_ascii_element(pmt_inf, "CtrlSum", _format_amount(batch.total_amount))
+        
+        # Payment Type Information
+        pmt_tp_inf = self._create_element(pmt_inf, "PmtTpInf")
+        svc_lvl = self._create_element(pmt_tp_inf, "SvcLvl")
+        self._create_ascii_element(svc_lvl, "Cd", batch.service_level)
+        
+        # Requested Execution Date
+        reqd_exctn_dt = self._create_element(pmt_inf, "ReqdExctnDt")
+        self._create_ascii_element(reqd_exctn_dt, "Dt", batch.requested_execution_date.date().isoformat())
+        
+        # Debtor Information (from first payment in batch)
+        if batch.payments:
+            first_payment = batch.payments[0]
+            address = first_payment.debtor_address
+            address_key = None
+            if address:
+                address_key = (address.street, address.building_number, address.postal_code,
+                               address.city, address.country)
+            pmt_inf.extend(self._cached_fragments(
+                ("Dbtr", first_payment.debtor_name, first_payment.debtor_iban,
+                 first_payment.debtor_bic, address_key),
+                lambda: self._build_debtor(first_payment),
+            ))
+    
+    def _fill_transaction(self, cdt_trf_tx: ET.Element, payment: PaymentInstruction) -> None:
+        """
+        Remplit une transaction de virement (CdtTrfTxInf)
+        
+        Chemin critique (un appel par paiement) : les nœuds sont créés sous
+        leur parent par SubElement lié localement, sans passer par
+        _create_element ; les textes sont convertis par str() comme dans
+        _create_element.
+        """
+        sub = ET.SubElement
+        
+        # Payment Identification
+        pmt_id = sub(cdt_trf_tx, "PmtId")
+        sub(pmt_id, "InstrId").text = str(payment.instruction_id)
+        sub(pmt_id, "EndToEndId").text = str(payment.end_to_end_id)
+        
+        # Amount
+        sub(sub(cdt_trf_tx, "Amt"), "InstdAmt", Ccy=payment.currency).text = _format_amount(payment.amount)
+        
+        # Creditor Agent
+        sub(sub(sub(cdt_trf_tx, "CdtrAgt"), "FinInstnId"), "BICFI").text = str(payment.creditor_bic)
+        
+        # Creditor
+        cdtr = sub(cdt_trf_tx, "Cdtr")
+        sub(cdtr, "Nm").text = str(payment.creditor_name)
+        if payment.creditor_address:
+            self._add_address(cdtr, payment.creditor_address)
+        
+        # Creditor Account
+        sub(sub(sub(cdt_trf_tx, "CdtrAcct"), "Id"), "IBAN").text = str(payment.creditor_iban)
+        
+        # Remittance Information
+        sub(sub(cdt_trf_tx, "RmtInf"), "Ustrd").text = str(payment.remittance_info)
+    
+    def _fill_payment_info_block(self, pmt_inf: ET.Element, batch: PaymentBatch) -> None:
+        """Remplit un lot complet (PmtInf) : en-tête puis transactions"""
+        self._fill_payment_info(pmt_inf, batch)
+        
+        # Credit Transfer Transactions
+        for payment in batch.payments:
+            self._fill_transaction(self._create_element(pmt_inf, "CdtTrfTxInf"), payment)
     
     def generate_pain001(
         self,
@@ -105,6 +368,7 @@ class ISO20022Generator:
         initiating_party_name: str,
         batches: List[PaymentBatch],
         initiating_party_id: Optional[str] = None,
+        max_workers: Optional[int] = None,
     ) -> str:
         """
         Génère un message pain.001 (Customer Credit Transfer Initiation)
@@ -112,8 +376,12 @@ class ISO20022Generator:
         Args:
             message_id: Identifiant unique du message
             initiating_party_name: Nom de l'initiateur du paiement
-            batches: Liste des lots de paiements
+            batches: Liste des lots de paiements (PaymentBatch ou PaymentBatchSoA)
             initiating_party_id: Identifiant optionnel de l'initiateur
+            max_workers: Si renseigné, les lots sont construits en parallèle
+                dans autant de processus. Le démarrage des processus et le
+                transfert des lots ne sont amortis que sur plusieurs lots
+                de plusieurs dizaines de milliers de paiements.
             
         Returns:
             str: Message XML formaté
@@ -122,108 +390,94 @@ class ISO20022Generator:
         root = ET.Element("Document", xmlns=self.NAMESPACE)
         cstmr_cdt_trf = self._create_element(root, "CstmrCdtTrfInitn")
         
-        # Calcul des totaux
-        total_transactions = sum(b.transaction_count for b in batches)
-        total_amount = sum(b.total_amount for b in batches)
-        
         # ========== GROUP HEADER ==========
         grp_hdr = self._create_element(cstmr_cdt_trf, "GrpHdr")
-        self._create_element(grp_hdr, "MsgId", message_id)
-        self._create_element(grp_hdr, "CreDtTm", datetime.utcnow().isoformat())
-        self._create_element(grp_hdr, "NbOfTxs", str(total_transactions))
-        self._create_element(grp_hdr, "CtrlSum", f"{total_amount:.2f}")
-        
-        # Initiating Party
-        initg_pty = self._create_element(grp_hdr, "InitgPty")
-        self._create_element(initg_pty, "Nm", initiating_party_name)
-        
-        if initiating_party_id:
-            initg_pty_id = self._create_element(initg_pty, "Id")
-            org_id = self._create_element(initg_pty_id, "OrgId")
-            othr = self._create_element(org_id, "Othr")
-            self._create_element(othr, "Id", initiating_party_id)
+        self._fill_group_header(grp_hdr, message_id, initiating_party_name, batches, initiating_party_id)
         
         # ========== PAYMENT INFORMATION ==========
-        for batch in batches:
-            pmt_inf = self._create_element(cstmr_cdt_trf, "PmtInf")
-            self._create_element(pmt_inf, "PmtInfId", batch.payment_info_id)
-            self._create_element(pmt_inf, "PmtMtd", batch.payment_method)
-            self._create_element(pmt_inf, "BtchBookg", str(batch.batch_booking).lower())
-            self._create_element(pmt_inf, "NbOfTxs", str(batch.transaction_count))
-            self._create_element(pmt_inf, "CtrlSum", f"{batch.total_amount:.2f}")
+        if max_workers and len(batches) > 1:
+            # Importés ici : multiprocessing alourdit l'import du module
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
             
-            # Payment Type Information
-            pmt_tp_inf = self._create_element(pmt_inf, "PmtTpInf")
-            svc_lvl = self._create_element(pmt_tp_inf, "SvcLvl")
-            self._create_element(svc_lvl, "Cd", batch.service_level)
-            
-            # Requested Execution Date
-            reqd_exctn_dt = self._create_element(pmt_inf, "ReqdExctnDt")
-            self._create_element(reqd_exctn_dt, "Dt", 
-                               batch.requested_execution_date.date().isoformat())
-            
-            # Debtor Information (from first payment in batch)
-            if batch.payments:
-                first_payment = batch.payments[0]
-                
-                # Debtor
-                dbtr = self._create_element(pmt_inf, "Dbtr")
-                self._create_element(dbtr, "Nm", first_payment.debtor_name)
-                if first_payment.debtor_address:
-                    self._add_address(dbtr, first_payment.debtor_address)
-                
-                # Debtor Account
-                dbtr_acct = self._create_element(pmt_inf, "DbtrAcct")
-                dbtr_acct_id = self._create_element(dbtr_acct, "Id")
-                self._create_element(dbtr_acct_id, "IBAN", first_payment.debtor_iban)
-                
-                # Debtor Agent
-                dbtr_agt = self._create_element(pmt_inf, "DbtrAgt")
-                fin_instn_id = self._create_element(dbtr_agt, "FinInstnId")
-                self._create_element(fin_instn_id, "BICFI", first_payment.debtor_bic)
-            
-            # Credit Transfer Transactions
-            for payment in batch.payments:
-                cdt_trf_tx = self._create_element(pmt_inf, "CdtTrfTxInf")
-                
-                # Payment Identification
-                pmt_id = self._create_element(cdt_trf_tx, "PmtId")
-                self._create_element(pmt_id, "InstrId", payment.instruction_id)
-                self._create_element(pmt_id, "EndToEndId", payment.end_to_end_id)
-                
-                # Amount
-                amt = self._create_element(cdt_trf_tx, "Amt")
-                instd_amt = ET.SubElement(amt, "InstdAmt", Ccy=payment.currency)
-                instd_amt.text = f"{payment.amount:.2f}"
-                
-                # Creditor Agent
-                cdtr_agt = self._create_element(cdt_trf_tx, "CdtrAgt")
-                cdtr_fin_instn = self._create_element(cdtr_agt, "FinInstnId")
-                self._create_element(cdtr_fin_instn, "BICFI", payment.creditor_bic)
-                
-                # Creditor
-                cdtr = self._create_element(cdt_trf_tx, "Cdtr")
-                self._create_element(cdtr, "Nm", payment.creditor_name)
-                if payment.creditor_address:
-                    self._add_address(cdtr, payment.creditor_address)
-                
-                # Creditor Account
-                cdtr_acct = self._create_element(cdt_trf_tx, "CdtrAcct")
-                cdtr_acct_id = self._create_element(cdtr_acct, "Id")
-                self._create_element(cdtr_acct_id, "IBAN", payment.creditor_iban)
-                
-                # Remittance Information
-                rmt_inf = self._create_element(cdt_trf_tx, "RmtInf")
-                self._create_element(rmt_inf, "Ustrd", payment.remittance_info)
+            # Processus démarrés par "spawn" : un enfant issu de fork hérite
+            # des verrous de pools de threads déjà lancés (Numba, BLAS...)
+            # et peut s'y bloquer
+            with ProcessPoolExecutor(max_workers=max_workers,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                for fragment in executor.map(_serialize_payment_info, batches):
+                    cstmr_cdt_trf.append(ET.fromstring(fragment))
+        else:
+            for batch in batches:
+                self._fill_payment_info_block(self._create_element(cstmr_cdt_trf, "PmtInf"), batch)
         
         # Formatage XML avec indentation
-        xml_str = ET.tostring(root, encoding="unicode")
-        return minidom.parseString(xml_str).toprettyxml(indent="  ")
+        if HAS_LXML:
+            return ET.tostring(root, pretty_print=True, xml_declaration=True, encoding="UTF-8").decode("utf-8")
+        ET.indent(root, space="  ")
+        return ET.tostring(root, encoding="unicode", xml_declaration=True)
     
-    def save_to_file(self, xml_content: str, filename: str) -> None:
-        """Sauvegarde le message XML dans un fichier"""
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write(xml_content)
+    def write_pain001(
+        self,
+        path: str,
+        message_id: str,
+        initiating_party_name: str,
+        batches: List[PaymentBatch],
+        initiating_party_id: Optional[str] = None,
+        buffer_size: int = 1 << 20,
+    ) -> None:
+        """
+        Écrit un message pain.001 directement dans un fichier, en flux
+        
+        Avec lxml, chaque transaction est sérialisée dès sa construction
+        (etree.xmlfile) : la mémoire reste bornée à une transaction quel que
+        soit le nombre de paiements. Le fichier produit n'est pas indenté.
+        Sans lxml, le message est généré en mémoire puis sauvegardé.
+        
+        Args:
+            path: Chemin du fichier XML de sortie
+            message_id: Identifiant unique du message
+            initiating_party_name: Nom de l'initiateur du paiement
+            batches: Liste des lots de paiements
+            initiating_party_id: Identifiant optionnel de l'initiateur
+            buffer_size: Taille du tampon d'écriture en octets
+        """
+        if not HAS_LXML:
+            xml_content = self.generate_pain001(message_id, initiating_party_name, batches, initiating_party_id)
+            self.save_to_file(xml_content, path, buffer_size)
+            return
+        
+        with open(path, 'wb', buffering=buffer_size) as f, ET.xmlfile(f, encoding="UTF-8") as xf:
+            xf.write_declaration()
+            with xf.element("Document", nsmap={None: self.NAMESPACE}):
+                with xf.element("CstmrCdtTrfInitn"):
+                    grp_hdr = ET.Element("GrpHdr")
+                    self._fill_group_header(grp_hdr, message_id, initiating_party_name, batches, initiating_party_id)
+                    xf.write(grp_hdr)
+                    
+                    for batch in batches:
+                        with xf.element("PmtInf"):
+                            pmt_inf = ET.Element("PmtInf")
+                            self._fill_payment_info(pmt_inf, batch)
+                            for child in pmt_inf:
+                                xf.write(child)
+                            
+                            for payment in batch.payments:
+                                cdt_trf_tx = ET.Element("CdtTrfTxInf")
+                                self._fill_transaction(cdt_trf_tx, payment)
+                                xf.write(cdt_trf_tx)
+    
+    def save_to_file(self, xml_content: str, filename: str, buffer_size: int = 1 << 20) -> None:
+        """Sauvegarde le message XML dans un fichier (encodé en UTF-8 en une seule fois)"""
+        with open(filename, 'wb', buffering=buffer_size) as f:
+            f.write(xml_content.encode('utf-8'))
+
+
+def _serialize_payment_info(batch: PaymentBatch) -> bytes:
+    """Construit et sérialise un bloc PmtInf (exécuté dans un processus de travail)"""
+    pmt_inf = ET.Element("PmtInf")
+    ISO20022Generator()._fill_payment_info_block(pmt_inf, batch)
+    return ET.tostring(pmt_inf)
 
 
 def create_sample_payment() -> PaymentInstruction:
@@ -18,11 +18,16 @@ Commandes disponibles:
 """
 
 import argparse
+import functools
+import itertools
 import json
+import os
+import queue
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
 
 try:
     # When installed as a package
@@ -48,9 +53,77 @@ except ImportError:
     from mt103_generator import MT103Message, Party
 
 
+@functools.lru_cache(maxsize=8)
+def _read_config(path: str, mtime_ns: int) -> dict:
+    """Lit un fichier de configuration JSON (mémorisé par chemin et date de modification)"""
+    return json.loads(Path(path).read_bytes())
+
+
+def _load_config(path: str) -> dict:
+    """
+    Charge un fichier de configuration JSON
+    
+    Une même configuration relue dans le même processus (appels successifs
+    de SwiftCLI.run) n'est analysée qu'une fois tant que le fichier n'est
+    pas modifié. Le dictionnaire retourné est partagé : à lire seulement.
+    """
+    return _read_config(path, os.stat(path).st_mtime_ns)
+
+
+
+def _read_ahead(f: TextIO, chunk_lines: int = 4096, depth: int = 4) -> Iterator[str]:
+    """
+    Itère sur les lignes d'un fichier lues par un thread, par blocs
+    
+    Le thread lit les blocs suivants (au plus `depth` d'avance) pendant que
+    l'appelant valide le bloc courant : la lecture disque, qui libère le
+    GIL, recouvre la validation.
+    """
+    chunks: "queue.Queue[Optional[List[str]]]" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    errors: List[BaseException] = []
+    
+    def produce() -> None:
+        try:
+            while not stop.is_set():
+                chunk = list(itertools.islice(f, chunk_lines))
+                if not chunk:
+                    break
+                chunks.put(chunk)
+        except BaseException as exc:
+            errors.append(exc)
+        finally:
+            chunks.put(None)
+    
+    reader = threading.Thread(target=produce, name="batch-reader", daemon=True)
+    reader.start()
+    try:
+        while (chunk := chunks.get()) is not None:
+            yield from chunk
+    finally:
+        # Arrêt anticipé de l'appelant : débloque le thread s'il attend une place
+        stop.set()
+        while reader.is_alive():
+            try:
+                chunks.get(timeout=0.05)
+            except queue.Empty:
+                pass
+        reader.join()
+    if errors:
+        raise errors[0]
+
+
+
 class SwiftCLI:
     """Interface en ligne de commande pour le système SWIFT"""
     
+    # Nombre de codes à partir duquel batch-validate répartit la validation sur plusieurs processus
+    PARALLEL_THRESHOLD = 50_000
+    
+    # Nombre d'IBAN à partir duquel batch-validate passe à la validation par lot
+    # NumPy/Numba (l'import de Numba et la compilation coûtent près d'une seconde)
+    JIT_THRESHOLD = 250_000
+    
     def __init__(self):
         self.parser = self._create_parser()
     
@@ -172,6 +245,11 @@ Exemples d'utilisation:
         mt103_parser.add_argument("--creditor-bic", type=str, help="BIC du créditeur")
         mt103_parser.add_argument("--remittance-info", type=str, default="Payment", help="Information de remise")
         mt103_parser.add_argument("--charges", type=str, default="SHA", choices=["SHA", "OUR", "BEN"], help="Type de frais")
+        mt103_parser.add_argument(
+            "--no-validate",
+            action="store_true",
+            help="Ne pas valider le message avant génération (données déjà contrôlées)"
+        )
         
         # Sous-parser: batch-validate
         batch_parser = subparsers.add_parser(
@@ -290,11 +368,12 @@ Exemples d'utilisation:
     def _generate_pain001(self, args) -> int:
         """Génère un message pain.001"""
         generator = ISO20022Generator()
+        # Horodatage unique pour tous les identifiants générés par défaut
+        ts = datetime.now().strftime('%Y%m%d%H%M%S')
         
         if args.config:
             # Charger depuis fichier JSON
-            with open(args.config, 'r') as f:
-                config = json.load(f)
+            config = _load_config(args.config)
             
             payments = []
             for idx, p in enumerate(config.get("payments", [])):
@@ -313,11 +392,11 @@ Exemples d'utilisation:
                 payments.append(payment)
             
             batch = PaymentBatch(
-                payment_info_id=config.get("batch_id", f"BATCH-{datetime.now().strftime('%Y%m%d%H%M%S')}"),
+                payment_info_id=config.get("batch_id", f"BATCH-{ts}"),
                 payments=payments
             )
             
-            message_id = args.message_id or config.get("message_id", f"MSG-{datetime.now().strftime('%Y%m%d%H%M%S')}")
+            message_id = args.message_id or config.get("message_id", f"MSG-{ts}")
             initiator = args.initiator or config.get("initiator", "CLI User")
             
         else:
@@ -328,7 +407,7 @@ Exemples d'utilisation:
                 return 1
             
             payment = PaymentInstruction(
-                instruction_id=f"INSTR-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+                instruction_id=f"INSTR-{ts}",
                 amount=args.amount,
                 currency=args.currency,
                 debtor_name=args.debtor_name,
@@ -341,11 +420,11 @@ Exemples d'utilisation:
             )
             
             batch = PaymentBatch(
-                payment_info_id=f"BATCH-{datetime.now().strftime('%Y%m%d%H%M%S')}",
+                payment_info_id=f"BATCH-{ts}",
                 payments=[payment]
             )
             
-            message_id = args.message_id or f"MSG-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            message_id = args.message_id or f"MSG-{ts}"
             initiator = args.initiator
         
         xml_output = generator.generate_pain001(
@@ -355,8 +434,7 @@ Exemples d'utilisation:
         )
         
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(xml_output)
+            generator.save_to_file(xml_output, args.output)
             print(f"Message pain.001 généré: {args.output}")
         else:
             print(xml_output)
@@ -365,9 +443,11 @@ Exemples d'utilisation:
     
     def _generate_mt103(self, args) -> int:
         """Génère un message MT103"""
+        # Horodatage unique : date de valeur et référence par défaut
+        now = datetime.now()
+        ts = now.strftime('%Y%m%d%H%M%S')
         if args.config:
-            with open(args.config, 'r') as f:
-                config = json.load(f)
+            config = _load_config(args.config)
             
             ordering = Party(
                 name=config["debtor"]["name"],
@@ -384,9 +464,9 @@ Exemples d'utilisation:
             )
             
             mt103 = MT103Message(
-                sender_reference=config.get("reference", f"REF{datetime.now().strftime('%Y%m%d%H%M%S')}")[:16],
+                sender_reference=config.get("reference", f"REF{ts}")[:16],
                 bank_operation_code="CRED",
-                value_date=datetime.now(),
+                value_date=now,
                 currency=config.get("currency", "EUR"),
                 amount=config["amount"],
                 ordering_customer=ordering,
@@ -403,19 +483,19 @@ Exemples d'utilisation:
                 return 1
             
             ordering = Party(
-                name=args.debtor_name.upper()[:35],
+                name=args.debtor_name.upper(),
                 account=args.debtor_iban
             )
             
             beneficiary = Party(
-                name=args.creditor_name.upper()[:35],
+                name=args.creditor_name.upper(),
                 account=args.creditor_iban
             )
             
             mt103 = MT103Message(
-                sender_reference=args.reference or f"REF{datetime.now().strftime('%Y%m%d%H%M%S')}"[:16],
+                sender_reference=args.reference or f"REF{ts}"[:16],
                 bank_operation_code="CRED",
-                value_date=datetime.now(),
+                value_date=now,
                 currency=args.currency,
                 amount=args.amount,
                 ordering_customer=ordering,
@@ -426,78 +506,141 @@ Exemples d'utilisation:
                 charges=args.charges
             )
         
-        # Validation
-        errors = mt103.validate()
-        if errors:
-            for error in errors:
-                self._error(error)
-            return 1
+        # Validation (sautée pour des données déjà contrôlées en amont)
+        if not args.no_validate:
+            errors = mt103.validate()
+            if errors:
+                for error in errors:
+                    self._error(error)
+                return 1
         
         output = mt103.generate()
         
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(output)
+            Path(args.output).write_text(output, encoding='utf-8')
             print(f"Message MT103 généré: {args.output}")
         else:
             print(output)
         
         return 0
     
-    def _batch_validate(self, args) -> int:
-        """Valide un fichier de BIC ou IBAN"""
-        results = []
+    def _jit_validator(self, validate):
+        """
+        Retourne la variante par lot (NumPy, compilée si Numba est présent) de `validate`, ou None
+        
+        NumPy et Numba sont optionnels et importés seulement ici.
+        """
+        if validate is not validate_iban:
+            return None
+        try:
+            try:
+                # When installed as a package
+                from swift_cli.iban_validator_jit import validate_iban_many
+            except ImportError:
+                # When running directly
+                from iban_validator_jit import validate_iban_many
+        except ImportError:
+            return None
+        return validate_iban_many
+    
+    def _iter_batch_results(self, lines: Iterable[str], validate) -> Iterator[dict]:
+        """
+        Produit le résultat de chaque code non vide, dans l'ordre du fichier
+        
+        Les petits fichiers sont validés en flux dans ce processus. À partir
+        de JIT_THRESHOLD IBAN, si NumPy est installé, le lot est chargé en
+        mémoire et validé par iban_validator_jit (noyau Numba ou colonnes NumPy). À partir de PARALLEL_THRESHOLD
+        codes (et avec plusieurs cœurs), les autres lots sont chargés en
+        mémoire et répartis sur un pool de processus.
+        """
+        codes = (line for line in (raw.strip() for raw in lines) if line)
+        head = list(itertools.islice(codes, max(self.PARALLEL_THRESHOLD, self.JIT_THRESHOLD)))
+        workers = os.cpu_count() or 1
+        
+        validate_many = self._jit_validator(validate) if len(head) >= self.JIT_THRESHOLD else None
+        if validate_many is not None:
+            codes = head + list(codes)
+            for code, (is_valid, message) in zip(codes, validate_many(codes)):
+                yield {"input": code, "valid": is_valid, "message": message}
+            return
+        
+        if len(head) < self.PARALLEL_THRESHOLD or workers < 2:
+            for code in itertools.chain(head, codes):
+                is_valid, message = validate(code)
+                yield {"input": code, "valid": is_valid, "message": message}
+            return
+        
+        # Importés ici : inutiles pour les petits fichiers
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        
+        codes = head + list(codes)
+        chunksize = max(1, len(codes) // (workers * 4))
+        # "spawn" : un enfant issu de fork peut hériter de verrous de threads déjà pris
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as executor:
+            outcomes = executor.map(validate, codes, chunksize=chunksize)
+            for code, (is_valid, message) in zip(codes, outcomes):
+                yield {"input": code, "valid": is_valid, "message": message}
+    
+    def _write_json_report(self, out: TextIO, results: Iterable[dict]) -> Tuple[int, int]:
+        """
+        Écrit le rapport JSON au fil de l'eau, sans garder les résultats en mémoire
+        
+        Returns:
+            tuple: (valid_count, invalid_count)
+        """
         valid_count = 0
         invalid_count = 0
         
-        with open(args.file, 'r') as f:
-            lines = [line.strip() for line in f if line.strip()]
-        
-        for line in lines:
-            if args.type == "bic":
-                is_valid, message = validate_bic(line)
-            else:
-                is_valid, message = validate_iban(line)
-            
-            results.append({
-                "input": line,
-                "valid": is_valid,
-                "message": message
-            })
-            
-            if is_valid:
+        out.write('{\n  "results": [')
+        for entry in results:
+            out.write(",\n    " if valid_count + invalid_count else "\n    ")
+            out.write(json.dumps(entry, ensure_ascii=False))
+            if entry["valid"]:
                 valid_count += 1
             else:
                 invalid_count += 1
         
-        summary = {
-            "total": len(results),
-            "valid": valid_count,
-            "invalid": invalid_count,
-            "results": results
-        }
+        total = valid_count + invalid_count
+        out.write("\n  ],\n" if total else "],\n")
+        out.write(f'  "total": {total},\n  "valid": {valid_count},\n  "invalid": {invalid_count}\n}}\n')
+        return valid_count, invalid_count
+    
+    def _batch_validate(self, args) -> int:
+        """Valide un fichier de BIC ou IBAN (lu et rapporté en flux)"""
+        # Validateur choisi une fois pour tout le fichier
+        validate = validate_bic if args.type == "bic" else validate_iban
         
-        if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
-            print(f"Rapport généré: {args.output}")
-            print(f"Total: {len(results)} | Valides: {valid_count} | Invalides: {invalid_count}")
-        else:
-            if hasattr(args, 'json') and args.json:
-                print(json.dumps(summary, indent=2, ensure_ascii=False))
+        # Le fichier d'entrée est ouvert avant toute écriture du rapport
+        with open(args.file, 'r', buffering=1 << 20) as f:
+            results = self._iter_batch_results(_read_ahead(f), validate)
+            
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8', buffering=1 << 20) as out:
+                    valid_count, invalid_count = self._write_json_report(out, results)
+                print(f"Rapport généré: {args.output}")
+                print(f"Total: {valid_count + invalid_count} | Valides: {valid_count} | Invalides: {invalid_count}")
+            elif hasattr(args, 'json') and args.json:
+                valid_count, invalid_count = self._write_json_report(sys.stdout, results)
             else:
+                valid_count = 0
+                invalid_count = 0
                 print(f"\n{'='*60}")
                 print(f"Rapport de validation ({args.type.upper()})")
                 print(f"{'='*60}")
                 for r in results:
                     status = "✓" if r["valid"] else "✗"
                     print(f"{status} {r['input']:40} : {r['message']}")
+                    if r["valid"]:
+                        valid_count += 1
+                    else:
+                        invalid_count += 1
                 print(f"{'='*60}")
-                print(f"Total: {len(results)} | Valides: {valid_count} | Invalides: {invalid_count}")
+                print(f"Total: {valid_count + invalid_count} | Valides: {valid_count} | Invalides: {invalid_count}")
         
         return 0 if invalid_count == 0 else 1
 
-
 def main():
     """Point d'entrée principal."""
     cli = SwiftCLI()
@@ -7,8 +7,40 @@ Format legacy pré-ISO 20022
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
-import re
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
+
+# Longueur maximale d'une ligne de champ SWIFT (format 35x)
+SWIFT_LINE_LENGTH = 35
+
+
+def _is_upper_alpha(value: str, length: int) -> bool:
+    """Vérifie que la valeur est formée d'exactement `length` lettres majuscules ASCII"""
+    return len(value) == length and value.isascii() and value.isalpha() and value.isupper()
+
+
+def _is_bic(value: str) -> bool:
+    """
+    Vérifie le format d'un BIC : 6 lettres majuscules, puis 2 ou 5
+    lettres majuscules ou chiffres (soit 8 ou 11 caractères)
+    """
+    # isupper() sur l'ensemble suffit : les 6 lettres garantissent un caractère à casse
+    return (len(value) in (8, 11) and value.isascii() and value.isalnum()
+            and value.isupper() and value[:6].isalpha())
+
+
+def _chunks(value: str, width: int, max_lines: int) -> List[str]:
+    """Découpe une chaîne en au plus `max_lines` lignes de `width` caractères"""
+    return [value[i:i + width] for i in range(0, min(len(value), width * max_lines), width)]
+
+
+# Champs du gabarit MT103 (arguments des fonctions produites par MT103Message.build_formatter)
+_TEMPLATE_FIELDS = (
+    "sender_bic", "receiver_bic", "reference", "operation_code", "instruction_code",
+    "value_date", "currency", "amount", "instructed_amount", "ordering_customer",
+    "ordering_institution", "beneficiary_institution", "beneficiary_customer",
+    "remittance_info", "charges", "sender_to_receiver_info",
+)
 
 
 @dataclass
@@ -20,8 +52,23 @@ class Party:
     address_line2: Optional[str] = None
     address_line3: Optional[str] = None
     
-    def to_lines(self, max_lines: int = 4, line_length: int = 35) -> List[str]:
-        """Convertit en lignes formatées SWIFT"""
+    def __post_init__(self):
+        """Tronque nom et adresse à une ligne SWIFT (35 caractères), une fois à la création"""
+        self.name = self.name[:SWIFT_LINE_LENGTH]
+        if self.address_line1:
+            self.address_line1 = self.address_line1[:SWIFT_LINE_LENGTH]
+        if self.address_line2:
+            self.address_line2 = self.address_line2[:SWIFT_LINE_LENGTH]
+        if self.address_line3:
+            self.address_line3 = self.address_line3[:SWIFT_LINE_LENGTH]
+    
+    def to_lines(self, max_lines: int = 4, line_length: int = SWIFT_LINE_LENGTH) -> List[str]:
+        """
+        Convertit en lignes formatées SWIFT
+        
+        Les champs tiennent déjà sur une ligne : à la longueur par défaut, les
+        découpes ci-dessous renvoient la chaîne elle-même, sans copie.
+        """
         lines = []
         if self.account:
             lines.append(f"/{self.account}")
@@ -80,78 +127,65 @@ class MT103Message:
         """Formate le montant selon le standard SWIFT (virgule décimale)"""
         return f"{amount:.2f}".replace(".", ",")
     
-    def _generate_block1(self) -> str:
-        """Block 1: Basic Header"""
-        # F = FIN, 01 = Application ID, sender BIC, session/sequence
-        return f"{{1:F01{self.sender_bic}0000000000}}"
-    
-    def _generate_block2(self) -> str:
-        """Block 2: Application Header Input"""
-        # I = Input, 103 = MT103, receiver BIC, N = Normal priority
-        return f"{{2:I103{self.receiver_bic}N}}"
-    
-    def _generate_block3(self) -> str:
-        """Block 3: User Header"""
-        return "{3:{108:MT103}}"
-    
-    def _generate_block4(self) -> str:
-        """Block 4: Text Block - Le contenu principal du message"""
-        lines = ["{4:"]
-        
-        # :20: Transaction Reference Number (obligatoire)
-        lines.append(f":20:{self.sender_reference[:16]}")
-        
-        # :23B: Bank Operation Code (obligatoire)
-        lines.append(f":23B:{self.bank_operation_code}")
-        
-        # :23E: Instruction Code (optionnel)
-        if self.instruction_code:
-            lines.append(f":23E:{self.instruction_code}")
-        
-        # :32A: Value Date/Currency/Amount (obligatoire)
-        date_str = self.value_date.strftime("%y%m%d")
-        amount_str = self._format_amount(self.amount)
-        lines.append(f":32A:{date_str}{self.currency}{amount_str}")
-        
-        # :33B: Currency/Instructed Amount (optionnel)
-        if self.instructed_amount:
-            inst_amount_str = self._format_amount(self.instructed_amount)
-            lines.append(f":33B:{self.currency}{inst_amount_str}")
-        
-        # :50K: Ordering Customer (obligatoire)
-        lines.append(":50K:" + "\n".join(self.ordering_customer.to_lines()))
-        
-        # :52A: Ordering Institution (optionnel mais recommandé)
-        lines.append(f":52A:{self.ordering_institution}")
-        
-        # :57A: Account With Institution (optionnel)
-        lines.append(f":57A:{self.beneficiary_institution}")
-        
-        # :59: Beneficiary Customer (obligatoire)
-        lines.append(":59:" + "\n".join(self.beneficiary_customer.to_lines()))
-        
-        # :70: Remittance Information (optionnel)
-        # Limité à 4 lignes de 35 caractères
-        remit_lines = [self.remittance_info[i:i+35] 
-                       for i in range(0, len(self.remittance_info), 35)][:4]
-        lines.append(":70:" + "\n".join(remit_lines))
-        
-        # :71A: Details of Charges (obligatoire)
-        lines.append(f":71A:{self.charges}")
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def build_formatter(optional_mask: Tuple[bool, bool, bool]) -> Callable[..., str]:
+        """
+        Construit le gabarit du message pour une combinaison de champs optionnels
         
-        # :72: Sender to Receiver Information (optionnel)
-        if self.sender_to_receiver_info:
-            s2r_lines = [self.sender_to_receiver_info[i:i+35]
-                        for i in range(0, len(self.sender_to_receiver_info), 35)][:6]
-            lines.append(":72:" + "\n".join(s2r_lines))
+        La structure du MT103 est fixe : seuls les champs optionnels (:23E:,
+        :33B:, :72:) changent le gabarit. Chaque gabarit est compilé une fois
+        par combinaison en une fonction dont le corps est une f-string : le
+        message est produit en une seule interpolation. Le gabarit reste
+        consultable dans l'attribut `template` de la fonction.
         
-        lines.append("-}")
-        return "\n".join(lines)
-    
-    def _generate_block5(self) -> str:
-        """Block 5: Trailer"""
-        # CHK = Checksum (simplifié pour l'exemple)
-        return "{5:{CHK:123456789ABC}}"
+        Args:
+            optional_mask: Présence de (:23E:, :33B:, :72:)
+            
+        Returns:
+            Callable: Fonction qui remplit le gabarit (arguments nommés, voir _TEMPLATE_FIELDS)
+        """
+        has_instruction_code, has_instructed_amount, has_sender_info = optional_mask
+        lines = [
+            # Block 1: Basic Header - F = FIN, 01 = Application ID, sender BIC, session/sequence
+            "{{1:F01{sender_bic}0000000000}}",
+            # Block 2: Application Header Input - I = Input, 103 = MT103, receiver BIC, N = Normal priority
+            "{{2:I103{receiver_bic}N}}",
+            # Block 3: User Header
+            "{{3:{{108:MT103}}}}",
+            # Block 4: Text Block - Le contenu principal du message
+            "{{4:",
+            ":20:{reference}",
+            ":23B:{operation_code}",
+        ]
+        if has_instruction_code:
+            lines.append(":23E:{instruction_code}")
+        lines.append(":32A:{value_date}{currency}{amount}")
+        if has_instructed_amount:
+            lines.append(":33B:{currency}{instructed_amount}")
+        lines += [
+            ":50K:{ordering_customer}",
+            ":52A:{ordering_institution}",
+            ":57A:{beneficiary_institution}",
+            ":59:{beneficiary_customer}",
+            ":70:{remittance_info}",
+            ":71A:{charges}",
+        ]
+        if has_sender_info:
+            lines.append(":72:{sender_to_receiver_info}")
+        lines += [
+            "-}}",
+            # Block 5: Trailer - CHK = Checksum (simplifié pour l'exemple)
+            "{{5:{{CHK:123456789ABC}}}}",
+        ]
+        template = "\n".join(lines)
+        # Le gabarit, accolades doublées comprises, est directement le texte d'une f-string
+        source = f"def format_message(*, {', '.join(_TEMPLATE_FIELDS)}):\n    return f{template!r}\n"
+        namespace = {}
+        exec(compile(source, "<mt103-template>", "exec"), namespace)
+        formatter = namespace["format_message"]
+        formatter.template = template
+        return formatter
     
     def generate(self) -> str:
         """
@@ -160,19 +194,41 @@ class MT103Message:
         Returns:
             str: Message MT103 formaté
         """
-        blocks = [
-            self._generate_block1(),
-            self._generate_block2(),
-            self._generate_block3(),
-            self._generate_block4(),
-            self._generate_block5(),
-        ]
-        return "\n".join(blocks)
+        formatter = self.build_formatter((
+            bool(self.instruction_code),
+            bool(self.instructed_amount),
+            bool(self.sender_to_receiver_info),
+        ))
+        return formatter(
+            sender_bic=self.sender_bic,
+            receiver_bic=self.receiver_bic,
+            reference=self.sender_reference[:16],
+            operation_code=self.bank_operation_code,
+            instruction_code=self.instruction_code,
+            value_date=self.value_date.strftime("%y%m%d"),
+            currency=self.currency,
+            amount=self._format_amount(self.amount),
+            instructed_amount=self._format_amount(self.instructed_amount) if self.instructed_amount else None,
+            ordering_customer="\n".join(self.ordering_customer.to_lines()),
+            ordering_institution=self.ordering_institution,
+            beneficiary_institution=self.beneficiary_institution,
+            beneficiary_customer="\n".join(self.beneficiary_customer.to_lines()),
+            # Limité à 4 lignes de 35 caractères
+            remittance_info="\n".join(_chunks(self.remittance_info, 35, 4)),
+            charges=self.charges,
+            sender_to_receiver_info=(
+                "\n".join(_chunks(self.sender_to_receiver_info, 35, 6)) if self.sender_to_receiver_info else None
+            ),
+        )
     
-    def validate(self) -> List[str]:
+    def validate(self, fail_fast: bool = False) -> List[str]:
         """
         Valide le message MT103
         
+        Args:
+            fail_fast: Si True, s'arrête à la première erreur (tri de lots,
+                où seule compte la présence d'une erreur)
+            
         Returns:
             List[str]: Liste des erreurs de validation (vide si valide)
         """
@@ -181,29 +237,42 @@ class MT103Message:
         # Validation :20: (1-16 caractères)
         if not self.sender_reference or len(self.sender_reference) > 16:
             errors.append(":20: Sender Reference doit contenir 1-16 caractères")
+            if fail_fast:
+                return errors
         
         # Validation :23B: (4 caractères alphabétiques)
-        if not re.match(r'^[A-Z]{4}$', self.bank_operation_code):
+        if not _is_upper_alpha(self.bank_operation_code, 4):
             errors.append(":23B: Bank Operation Code doit être 4 lettres (ex: CRED)")
+            if fail_fast:
+                return errors
         
         # Validation :32A: Currency (3 lettres ISO)
-        if not re.match(r'^[A-Z]{3}$', self.currency):
+        if not _is_upper_alpha(self.currency, 3):
             errors.append(":32A: Currency doit être un code ISO 3 lettres (ex: EUR)")
+            if fail_fast:
+                return errors
         
         # Validation :32A: Amount (positif)
         if self.amount <= 0:
             errors.append(":32A: Amount doit être positif")
+            if fail_fast:
+                return errors
         
         # Validation :71A: Charges
-        if self.charges not in ("SHA", "OUR", "BEN"):
+        if self.charges not in _CHARGES:
             errors.append(":71A: Charges doit être SHA, OUR ou BEN")
+            if fail_fast:
+                return errors
         
         # Validation BIC
-        bic_pattern = r'^[A-Z]{4}[A-Z]{2}[A-Z0-9]{2}([A-Z0-9]{3})?$'
-        if not re.match(bic_pattern, self.ordering_institution):
+        if not _is_bic(self.ordering_institution):
             errors.append(":52A: Ordering Institution BIC invalide")
-        if not re.match(bic_pattern, self.beneficiary_institution):
+            if fail_fast:
+                return errors
+        if not _is_bic(self.beneficiary_institution):
             errors.append(":57A: Beneficiary Institution BIC invalide")
+            if fail_fast:
+                return errors
         
         return errors
 
@@ -224,6 +293,9 @@ CHARGE_TYPES = {
     "BEN": "Beneficiary (tous les frais à la charge du bénéficiaire)",
 }
 
+# Codes de frais acceptés en :71A:
+_CHARGES = frozenset(CHARGE_TYPES)
+
 
 def create_sample_mt103() -> MT103Message:
     """Crée un exemple de message MT103"""
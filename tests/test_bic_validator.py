@@ -4,11 +4,6 @@ Tests for BIC/SWIFT Code Validator
 """
 
 import pytest
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'swift_cli'))
 
 from bic_validator import BICCode, validate_bic
 
@@ -107,6 +102,17 @@ class TestBICParsing:
         with pytest.raises(ValueError):
             BICCode.parse('BNP')
 
+    def test_validate_parsed_bic(self):
+        """Test that a parsed BIC validates"""
+        assert BICCode.parse('BNPAFRPPXXX').validate() is True
+        assert BICCode.parse('DEUTDEFF').validate() is True
+
+    def test_validate_invalid_fields(self):
+        """Test validation of a BIC built with invalid fields"""
+        assert BICCode('BNP1', 'FR', 'PP').validate() is False
+        assert BICCode('BNPA', 'FR', 'PP', 'XX').validate() is False
+        assert BICCode('BNPA', 'FR', 'P-').validate() is False
+
 
 class TestBICEdgeCases:
     """Edge case tests for BIC validation"""
@@ -125,3 +131,13 @@ class TestBICEdgeCases:
         """Test BIC with alphanumeric location code"""
         is_valid, _ = validate_bic('CHASUS33XXX')
         assert is_valid is True
+
+    def test_non_ascii_letters_rejected(self):
+        """Test that accented letters are not accepted as BIC letters"""
+        is_valid, _ = validate_bic('BNPAFRPPÉÉÉ')
+        assert is_valid is False
+
+    def test_punctuation_rejected(self):
+        """Test that punctuation in the location/branch part is rejected"""
+        is_valid, _ = validate_bic('BNPAFRP-XXX')
+        assert is_valid is False
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests for batch BIC validation (NumPy/Numba)
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from bic_validator import validate_bic
+from bic_validator_jit import validate_bic_batch
+
+
+class TestBICBatchValidation:
+    """Test cases for validate_bic_batch"""
+
+    CODES = [
+        'BNPAFRPPXXX',
+        'DEUTDEFF',
+        'bnpafrppxxx',
+        '  CHASUS33XXX  ',
+        'BNPA',
+        'INVALID',
+        '1234FRPP',
+        'BNPAFRPPXXXX',
+        'BNPAFRP-XXX',
+        'BNPAFRPPÉÉÉ',
+        '',
+    ]
+
+    def test_returns_boolean_array(self):
+        """Test that one boolean is returned per input code"""
+        result = validate_bic_batch(self.CODES)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.bool_
+        assert result.shape == (len(self.CODES),)
+
+    def test_matches_validate_bic(self):
+        """Test that batch results agree with validate_bic"""
+        result = validate_bic_batch(self.CODES)
+        expected = [validate_bic(code)[0] for code in self.CODES]
+        assert result.tolist() == expected
+
+    def test_empty_batch(self):
+        """Test validation of an empty list"""
+        assert validate_bic_batch([]).shape == (0,)
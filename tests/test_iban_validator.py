@@ -4,11 +4,6 @@ Tests for IBAN Validator
 """
 
 import pytest
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'swift_cli'))
 
 from iban_validator import IBAN, validate_iban
 
@@ -59,6 +54,12 @@ class TestIBANValidation:
         is_valid, message = validate_iban('FR76')
         assert is_valid is False
 
+    def test_length_checked_before_format(self):
+        """Test that a short, malformed IBAN is reported on its length"""
+        is_valid, message = validate_iban('INVALID123')
+        assert is_valid is False
+        assert 'trop court' in message
+
     def test_invalid_iban_wrong_length_for_country(self):
         """Test that IBAN with wrong length for country is invalid"""
         # French IBAN should be 27 chars, this is 25
@@ -66,6 +67,21 @@ class TestIBANValidation:
         assert is_valid is False
 
 
+    @pytest.mark.parametrize('iban_str', [
+        'FR7630006000011234567890189',
+        'GB82WEST12345698765432',
+        'FR7630006000011234567890188',
+        'INVALID123',
+        'FR76300060000112345678901',
+        'XX00123456789012',
+        'FR76-3000600001123456789018',
+    ])
+    def test_is_valid_matches_validate(self, iban_str):
+        """Test that is_valid() gives the same verdict as validate()"""
+        iban = IBAN(iban_str)
+        assert iban.is_valid() is iban.validate()[0]
+
+
 class TestIBANParsing:
     """Test cases for IBAN parsing and properties"""
 
@@ -119,6 +135,11 @@ class TestIBANGeneration:
         check_digits = IBAN.generate_check_digits('DE', '370400440532013000')
         assert check_digits == '89'
 
+    def test_generate_check_digits_letters_in_bban(self):
+        """Test check digits for a BBAN containing letters, in any case"""
+        assert IBAN.generate_check_digits('IT', 'X0542811101000000123456') == '60'
+        assert IBAN.generate_check_digits('it', 'x0542811101000000123456') == '60'
+
     def test_create_valid_iban(self):
         """Test creating a valid IBAN from country and BBAN"""
         iban = IBAN.create('FR', '30006000011234567890189')
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Tests for batch IBAN validation (NumPy/Numba)
+"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from iban_validator import validate_iban
+from iban_validator_jit import validate_iban_batch, validate_iban_many
+
+
+class TestIBANBatchValidation:
+    """Test cases for validate_iban_batch"""
+
+    CODES = [
+        'FR7630006000011234567890189',
+        'DE89 3704 0044 0532 0130 00',
+        'gb82west12345698765432',
+        'IT60X0542811101000000123456',
+        'BE68539007547034',
+        'FR7630006000011234567890188',
+        'DE8937040044053201300',
+        'INVALID123',
+        'XX00 1234 5678',
+        'XX9312345678901234',
+        'XX4212345678901234',
+        'FR76300060000112345678901É9',
+        'FR76-3000-6000-0112-3456-7890-189',
+        'FR' + '1' * 40,
+        '',
+    ]
+
+    def test_returns_boolean_array(self):
+        """Test that one boolean is returned per input IBAN"""
+        result = validate_iban_batch(self.CODES)
+        assert isinstance(result, np.ndarray)
+        assert result.dtype == np.bool_
+        assert result.shape == (len(self.CODES),)
+
+    def test_matches_validate_iban(self):
+        """Test that batch results agree with validate_iban"""
+        result = validate_iban_batch(self.CODES)
+        expected = [validate_iban(code)[0] for code in self.CODES]
+        assert result.tolist() == expected
+
+    def test_many_matches_validate_iban_messages(self):
+        """Test that validate_iban_many returns the validate_iban tuples"""
+        assert list(validate_iban_many(self.CODES)) == [validate_iban(code) for code in self.CODES]
+
+    def test_empty_batch(self):
+        """Test validation of an empty list"""
+        assert validate_iban_batch([]).shape == (0,)
+
+    def test_numpy_columns_match_validate_iban(self, monkeypatch):
+        """Test the NumPy fallback used when Numba is not installed"""
+        import iban_validator_jit
+        monkeypatch.setattr(iban_validator_jit, 'HAS_NUMBA', False)
+        monkeypatch.setattr(iban_validator_jit, 'COLUMN_BLOCK_ROWS', 4)
+        result = validate_iban_batch(self.CODES)
+        expected = [validate_iban(code)[0] for code in self.CODES]
+        assert result.tolist() == expected
@@ -6,19 +6,37 @@ Tests for ISO 20022 Message Generator
 import pytest
 import sys
 import os
+import subprocess
+from dataclasses import replace
 from datetime import datetime
-
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'swift_cli'))
+from xml.etree import ElementTree
 
 from iso20022_generator import (
     ISO20022Generator,
     PaymentInstruction,
     PaymentBatch,
+    PaymentBatchSoA,
     Address,
 )
 
 
+@pytest.fixture
+def sample_payment():
+    """Create a sample payment for testing"""
+    return PaymentInstruction(
+        instruction_id='TEST-001',
+        amount=1000.00,
+        currency='EUR',
+        debtor_name='Test Debtor',
+        debtor_iban='FR7630006000011234567890189',
+        debtor_bic='BNPAFRPPXXX',
+        creditor_name='Test Creditor',
+        creditor_iban='DE89370400440532013000',
+        creditor_bic='COBADEFFXXX',
+        remittance_info='Test Payment'
+    )
+
+
 class TestPaymentInstruction:
     """Test cases for PaymentInstruction dataclass"""
 
@@ -59,6 +77,39 @@ class TestPaymentInstruction:
         assert payment.end_to_end_id is not None
         assert len(payment.end_to_end_id) <= 35
 
+    def test_generated_end_to_end_ids_are_unique(self, sample_payment):
+        """Test that auto-generated end_to_end_ids differ between payments"""
+        payments = [replace(sample_payment, end_to_end_id=None) for _ in range(3)]
+        
+        ids = {p.end_to_end_id for p in payments}
+        assert len(ids) == 3
+        assert all(len(e2e_id) == 35 for e2e_id in ids)
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason='requires os.fork')
+    def test_forked_child_draws_new_end_to_end_ids(self, sample_payment):
+        """Test that a forked process does not replay the parent's end_to_end_ids"""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.close(read_fd)
+                os.write(write_fd, replace(sample_payment, end_to_end_id=None).end_to_end_id.encode())
+            finally:
+                os._exit(0)
+        
+        os.close(write_fd)
+        parent_id = replace(sample_payment, end_to_end_id=None).end_to_end_id
+        with os.fdopen(read_fd) as pipe:
+            child_id = pipe.read()
+        os.waitpid(pid, 0)
+        
+        assert len(child_id) == 35
+        assert child_id.split('-')[0] != parent_id.split('-')[0]
+
+    def test_payment_instruction_uses_slots(self, sample_payment):
+        """Test that payment instructions carry no per-instance __dict__"""
+        assert not hasattr(sample_payment, '__dict__')
+
     def test_custom_end_to_end_id(self):
         """Test providing custom end_to_end_id"""
         payment = PaymentInstruction(
@@ -140,25 +191,61 @@ class TestPaymentBatch:
         assert batch.total_amount == 1500.00
         assert batch.transaction_count == 2
 
+    def test_batch_total_amount_is_exact(self, sample_payment):
+        """Test that the batch total does not accumulate rounding drift"""
+        payments = [replace(sample_payment, amount=0.10) for _ in range(10)]
+        
+        batch = PaymentBatch(payment_info_id='BATCH-001', payments=payments)
+        assert batch.total_amount == 1.00
 
-class TestISO20022Generator:
-    """Test cases for ISO20022Generator"""
 
-    @pytest.fixture
-    def sample_payment(self):
-        """Create a sample payment for testing"""
-        return PaymentInstruction(
-            instruction_id='TEST-001',
-            amount=1000.00,
-            currency='EUR',
-            debtor_name='Test Debtor',
-            debtor_iban='FR7630006000011234567890189',
-            debtor_bic='BNPAFRPPXXX',
-            creditor_name='Test Creditor',
-            creditor_iban='DE89370400440532013000',
-            creditor_bic='COBADEFFXXX',
-            remittance_info='Test Payment'
+class TestPaymentBatchSoA:
+    """Test cases for the columnar PaymentBatchSoA"""
+
+    def test_add_fills_columns(self, sample_payment):
+        """Test that add() keeps rows and the amounts column in sync"""
+        batch = PaymentBatchSoA(payment_info_id='BATCH-001')
+        batch.add(sample_payment)
+        batch.add(replace(sample_payment, amount=500.00))
+        
+        assert batch.transaction_count == 2
+        assert list(batch.amounts) == [1000.00, 500.00]
+        assert batch.total_amount == 1500.00
+
+    def test_payments_are_read_only(self, sample_payment):
+        """Test that rows cannot be appended behind the amounts column"""
+        batch = PaymentBatchSoA(payment_info_id='BATCH-001', payments=[sample_payment])
+        
+        with pytest.raises(AttributeError):
+            batch.payments.append(sample_payment)
+
+    def test_from_batch(self, sample_payment):
+        """Test conversion from a PaymentBatch"""
+        batch = PaymentBatch(
+            payment_info_id='BATCH-001',
+            payments=[sample_payment, replace(sample_payment, amount=500.00)]
+        )
+        soa = PaymentBatchSoA.from_batch(batch)
+        
+        assert list(soa.payments) == batch.payments
+        assert soa.total_amount == batch.total_amount
+        assert soa.requested_execution_date == batch.requested_execution_date
+
+    def test_generate_pain001_accepts_soa_batch(self, sample_payment):
+        """Test that the generator accepts columnar batches"""
+        batch = PaymentBatchSoA(payment_info_id='BATCH-001', payments=[sample_payment])
+        xml = ISO20022Generator().generate_pain001(
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=[batch]
         )
+        
+        assert '<CtrlSum>1000.00</CtrlSum>' in xml
+        assert 'TEST-001' in xml
+
+
+class TestISO20022Generator:
+    """Test cases for ISO20022Generator"""
 
     @pytest.fixture
     def sample_batch(self, sample_payment):
@@ -212,6 +299,33 @@ class TestISO20022Generator:
         
         assert '1000.00' in xml
 
+    def test_generate_pain001_amount_currency(self, sample_batch):
+        """Test that instructed amount carries the currency attribute"""
+        generator = ISO20022Generator()
+        xml = generator.generate_pain001(
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=[sample_batch]
+        )
+        
+        assert '<InstdAmt Ccy="EUR">1000.00</InstdAmt>' in xml
+
+    def test_generate_pain001_zero_amount_ignores_signed_zero(self, sample_payment):
+        """Test that formatting -0.0 first does not change how 0.0 is written"""
+        generator = ISO20022Generator()
+        for amount in (-0.0, 0.0):
+            batch = PaymentBatch(
+                payment_info_id='BATCH-001',
+                payments=[replace(sample_payment, amount=amount)]
+            )
+            xml = generator.generate_pain001(
+                message_id='MSG-TEST-001',
+                initiating_party_name='Test Company',
+                batches=[batch]
+            )
+        
+        assert '<InstdAmt Ccy="EUR">0.00</InstdAmt>' in xml
+
     def test_generate_pain001_instruction_id(self, sample_batch):
         """Test that instruction ID is included in XML"""
         generator = ISO20022Generator()
@@ -223,6 +337,20 @@ class TestISO20022Generator:
         
         assert 'TEST-001' in xml
 
+    def test_generate_pain001_numeric_instruction_id(self, sample_payment):
+        """Test that non-string field values are written as text"""
+        batch = PaymentBatch(
+            payment_info_id='BATCH-001',
+            payments=[replace(sample_payment, instruction_id=42)]
+        )
+        xml = ISO20022Generator().generate_pain001(
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=[batch]
+        )
+        
+        assert '<InstrId>42</InstrId>' in xml
+
     def test_generate_pain001_namespace(self, sample_batch):
         """Test that ISO 20022 namespace is included"""
         generator = ISO20022Generator()
@@ -260,6 +388,138 @@ class TestISO20022Generator:
         assert 'FR7630006000011234567890189' in xml
         assert 'BNPAFRPPXXX' in xml
 
+    def test_generate_pain001_well_formed(self, sample_batch):
+        """Test that generated XML is well-formed and indented"""
+        generator = ISO20022Generator()
+        xml = generator.generate_pain001(
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=[sample_batch]
+        )
+        
+        root = ElementTree.fromstring(xml.encode('utf-8'))
+        assert root.tag == '{urn:iso:std:iso:20022:tech:xsd:pain.001.001.09}Document'
+        assert '\n  <CstmrCdtTrfInitn>' in xml
+
+    def test_generator_reuse_keeps_parties_distinct(self, sample_batch, sample_payment):
+        """Test that a reused generator emits the right initiator and debtor per message"""
+        generator = ISO20022Generator()
+        first = generator.generate_pain001(
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=[sample_batch],
+            initiating_party_id='ID-001'
+        )
+        other_payment = PaymentInstruction(
+            instruction_id='TEST-002',
+            amount=10.00,
+            currency='EUR',
+            debtor_name='Other Debtor',
+            debtor_iban='GB82WEST12345698765432',
+            debtor_bic='WESTGB2LXXX',
+            creditor_name='Test Creditor',
+            creditor_iban='DE89370400440532013000',
+            creditor_bic='COBADEFFXXX',
+            remittance_info='Test Payment'
+        )
+        second = generator.generate_pain001(
+            message_id='MSG-TEST-002',
+            initiating_party_name='Other Company',
+            batches=[PaymentBatch(payment_info_id='BATCH-002', payments=[other_payment]), sample_batch]
+        )
+        again = generator.generate_pain001(
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=[sample_batch],
+            initiating_party_id='ID-001'
+        )
+        
+        assert 'ID-001' in first and 'ID-001' not in second
+        assert 'Other Company' in second and 'Other Debtor' in second
+        assert second.count('<Nm>Test Debtor</Nm>') == 1
+        assert again.split('<InitgPty>')[1] == first.split('<InitgPty>')[1]
+
+    def test_generate_pain001_execution_date(self, sample_payment):
+        """Test that the requested execution date is emitted as an ISO date"""
+        batch = PaymentBatch(
+            payment_info_id='BATCH-001',
+            requested_execution_date=datetime(2026, 3, 2, 15, 30),
+            payments=[sample_payment]
+        )
+        xml = ISO20022Generator().generate_pain001(
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=[batch]
+        )
+        
+        assert '<Dt>2026-03-02</Dt>' in xml
+
+    def test_generate_pain001_execution_date_reassigned(self, sample_batch):
+        """Test that a date changed after batch creation is the one emitted"""
+        sample_batch.requested_execution_date = datetime(2030, 1, 1)
+        xml = ISO20022Generator().generate_pain001(
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=[sample_batch]
+        )
+        
+        assert '<Dt>2030-01-01</Dt>' in xml
+
+    def test_generate_pain001_parallel_batches(self, sample_batch, sample_payment):
+        """Test that parallel batch construction yields the sequential output"""
+        batches = [
+            sample_batch,
+            PaymentBatch(
+                payment_info_id='BATCH-002',
+                payments=[sample_payment, replace(sample_payment, end_to_end_id=None)]
+            ),
+        ]
+        generator = ISO20022Generator()
+        sequential = generator.generate_pain001(
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=batches
+        )
+        parallel = generator.generate_pain001(
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=batches,
+            max_workers=2
+        )
+        
+        assert parallel.split('</GrpHdr>')[1] == sequential.split('</GrpHdr>')[1]
+
+    def test_save_to_file_utf8(self, tmp_path):
+        """Test that saved files round-trip non-ASCII content as UTF-8"""
+        generator = ISO20022Generator()
+        output = tmp_path / 'message.xml'
+        generator.save_to_file('<Nm>Société Générale</Nm>', str(output))
+        
+        assert output.read_text(encoding='utf-8') == '<Nm>Société Générale</Nm>'
+
+    def test_write_pain001_matches_generate(self, sample_batch, tmp_path):
+        """Test that the streamed file carries the same content as generate_pain001"""
+        generator = ISO20022Generator()
+        output = tmp_path / 'pain001.xml'
+        generator.write_pain001(
+            str(output),
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=[sample_batch]
+        )
+        xml = generator.generate_pain001(
+            message_id='MSG-TEST-001',
+            initiating_party_name='Test Company',
+            batches=[sample_batch]
+        )
+        
+        def leaves(root):
+            return [(e.tag, (e.text or '').strip(), e.attrib) for e in root.iter()
+                    if not e.tag.endswith('CreDtTm')]
+        
+        streamed = ElementTree.parse(output).getroot()
+        assert leaves(streamed) == leaves(ElementTree.fromstring(xml.encode('utf-8')))
+
 
 class TestAddress:
     """Test cases for Address dataclass"""
@@ -282,3 +542,18 @@ class TestAddress:
         """Test default country is FR"""
         address = Address()
         assert address.country == 'FR'
+
+
+class TestLazyImport:
+    """Test cases for lazy loading from the swift_cli package"""
+
+    def test_package_import_defers_generator(self):
+        """Test that importing swift_cli does not load the ISO 20022 generator"""
+        code = (
+            "import sys, swift_cli\n"
+            "assert 'swift_cli.iso20022_generator' not in sys.modules\n"
+            "assert swift_cli.ISO20022Generator.__name__ == 'ISO20022Generator'\n"
+            "assert 'swift_cli.iso20022_generator' in sys.modules\n"
+        )
+        root = os.path.join(os.path.dirname(__file__), '..')
+        subprocess.run([sys.executable, '-c', code], cwd=root, check=True)
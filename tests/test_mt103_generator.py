@@ -4,15 +4,23 @@ Tests for SWIFT MT103 Message Generator
 """
 
 import pytest
-import sys
-import os
+import re
+from dataclasses import replace
 from datetime import datetime
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'swift_cli'))
-
 from mt103_generator import MT103Message, Party, BANK_OPERATION_CODES, CHARGE_TYPES
 
+# Fixed value date: the tests never read the clock
+FIXED_DATE = datetime(2026, 2, 14)
+
+# Tokens expected in the generated sample message, found in one regex pass
+EXPECTED_TOKENS = (
+    '{1:', '{2:', '{3:', '{4:', '{5:',  # Blocks 1 to 5
+    ':20:REF123456789', ':23B:CRED', ':71A:SHA',
+    '5000,00',  # European amount format
+)
+_TOKENS_RE = re.compile('|'.join(map(re.escape, EXPECTED_TOKENS)))
+
 
 class TestParty:
     """Test cases for Party dataclass"""
@@ -62,12 +70,19 @@ class TestParty:
         assert len(lines[0]) <= 35
 
 
+    def test_fields_truncated_at_creation(self):
+        """Test that name and address lines are cut to 35 characters once"""
+        party = Party(name='A' * 50, address_line1='B' * 40)
+        assert party.name == 'A' * 35
+        assert party.address_line1 == 'B' * 35
+        assert party.to_lines() == ['A' * 35, 'B' * 35]
+
 class TestMT103Message:
     """Test cases for MT103Message"""
 
-    @pytest.fixture
+    @pytest.fixture(scope='class')
     def sample_mt103(self):
-        """Create a sample MT103 message for testing"""
+        """Create a sample MT103 message shared by the class (tests derive variants with replace)"""
         ordering = Party(
             name='TEST COMPANY',
             account='FR7630006000011234567890189'
@@ -80,7 +95,7 @@ class TestMT103Message:
         return MT103Message(
             sender_reference='REF123456789',
             bank_operation_code='CRED',
-            value_date=datetime(2026, 2, 14),
+            value_date=FIXED_DATE,
             currency='EUR',
             amount=5000.00,
             ordering_customer=ordering,
@@ -96,161 +111,77 @@ class TestMT103Message:
         errors = sample_mt103.validate()
         assert len(errors) == 0
 
-    def test_validate_invalid_reference(self):
-        """Test validation fails for invalid reference"""
-        ordering = Party(name='TEST')
-        beneficiary = Party(name='BENEFICIARY')
-        
-        mt103 = MT103Message(
-            sender_reference='',  # Empty reference
-            bank_operation_code='CRED',
-            value_date=datetime.now(),
-            currency='EUR',
-            amount=1000.00,
-            ordering_customer=ordering,
-            ordering_institution='BNPAFRPPXXX',
-            beneficiary_customer=beneficiary,
-            beneficiary_institution='COBADEFFXXX',
-            remittance_info='TEST',
-            charges='SHA'
-        )
-        
-        errors = mt103.validate()
-        assert len(errors) > 0
-        assert any(':20:' in e for e in errors)
-
-    def test_validate_invalid_operation_code(self):
-        """Test validation fails for invalid bank operation code"""
-        ordering = Party(name='TEST')
-        beneficiary = Party(name='BENEFICIARY')
-        
-        mt103 = MT103Message(
-            sender_reference='REF123',
-            bank_operation_code='INVALID',  # Invalid code
-            value_date=datetime.now(),
-            currency='EUR',
-            amount=1000.00,
-            ordering_customer=ordering,
-            ordering_institution='BNPAFRPPXXX',
-            beneficiary_customer=beneficiary,
-            beneficiary_institution='COBADEFFXXX',
-            remittance_info='TEST',
-            charges='SHA'
-        )
-        
-        errors = mt103.validate()
-        assert len(errors) > 0
-        assert any(':23B:' in e for e in errors)
-
-    def test_validate_invalid_currency(self):
-        """Test validation fails for invalid currency"""
-        ordering = Party(name='TEST')
-        beneficiary = Party(name='BENEFICIARY')
-        
-        mt103 = MT103Message(
-            sender_reference='REF123',
-            bank_operation_code='CRED',
-            value_date=datetime.now(),
-            currency='EURO',  # Invalid (should be 3 chars)
-            amount=1000.00,
-            ordering_customer=ordering,
-            ordering_institution='BNPAFRPPXXX',
-            beneficiary_customer=beneficiary,
-            beneficiary_institution='COBADEFFXXX',
-            remittance_info='TEST',
-            charges='SHA'
-        )
-        
-        errors = mt103.validate()
-        assert len(errors) > 0
-        assert any(':32A:' in e for e in errors)
-
-    def test_validate_negative_amount(self):
-        """Test validation fails for negative amount"""
-        ordering = Party(name='TEST')
-        beneficiary = Party(name='BENEFICIARY')
-        
-        mt103 = MT103Message(
-            sender_reference='REF123',
-            bank_operation_code='CRED',
-            value_date=datetime.now(),
-            currency='EUR',
-            amount=-100.00,  # Negative
-            ordering_customer=ordering,
-            ordering_institution='BNPAFRPPXXX',
-            beneficiary_customer=beneficiary,
-            beneficiary_institution='COBADEFFXXX',
-            remittance_info='TEST',
-            charges='SHA'
-        )
-        
-        errors = mt103.validate()
+    @pytest.mark.parametrize('field_name,value,tag', [
+        ('sender_reference', '', ':20:'),
+        ('bank_operation_code', 'INVALID', ':23B:'),
+        ('currency', 'EURO', ':32A:'),
+        ('amount', -100.00, ':32A:'),
+        ('charges', 'INVALID', ':71A:'),
+    ])
+    def test_validate_invalid_field(self, sample_mt103, field_name, value, tag):
+        """Test validation fails, with the field tag, for one invalid field"""
+        errors = replace(sample_mt103, **{field_name: value}).validate()
         assert len(errors) > 0
-
-    def test_validate_invalid_charges(self):
-        """Test validation fails for invalid charges type"""
-        ordering = Party(name='TEST')
-        beneficiary = Party(name='BENEFICIARY')
-        
-        mt103 = MT103Message(
-            sender_reference='REF123',
-            bank_operation_code='CRED',
-            value_date=datetime.now(),
-            currency='EUR',
-            amount=1000.00,
-            ordering_customer=ordering,
-            ordering_institution='BNPAFRPPXXX',
-            beneficiary_customer=beneficiary,
-            beneficiary_institution='COBADEFFXXX',
-            remittance_info='TEST',
-            charges='INVALID'  # Invalid
-        )
-        
-        errors = mt103.validate()
-        assert len(errors) > 0
-        assert any(':71A:' in e for e in errors)
-
-    def test_generate_contains_reference(self, sample_mt103):
-        """Test generated message contains reference"""
-        message = sample_mt103.generate()
-        assert ':20:REF123456789' in message
-
-    def test_generate_contains_operation_code(self, sample_mt103):
-        """Test generated message contains operation code"""
+        assert any(tag in e for e in errors)
+
+    @pytest.mark.parametrize('bic', ['bnpafrppxxx', 'BNPAFRPPÉÉÉ', 'BNPAFRP', 'BNPA1RPPXXX', 'BNPAFRPP-XX'])
+    def test_validate_invalid_institution_bic(self, sample_mt103, bic):
+        """Test validation fails for malformed institution BICs"""
+        errors = replace(sample_mt103, ordering_institution=bic, beneficiary_institution=bic).validate()
+        assert any(':52A:' in e for e in errors)
+        assert any(':57A:' in e for e in errors)
+
+    def test_validate_short_institution_bic(self, sample_mt103):
+        """Test validation accepts 8-character BICs and digits in the location code"""
+        assert replace(sample_mt103, ordering_institution='CHASUS33').validate() == []
+
+    def test_validate_fail_fast_stops_at_first_error(self, sample_mt103):
+        """Test that fail_fast returns only the first validation error"""
+        mt103 = replace(sample_mt103, currency='euro', charges='INVALID')
+        assert len(mt103.validate()) == 2
+        assert mt103.validate(fail_fast=True) == mt103.validate()[:1]
+
+    def test_generate_contains_expected_tokens(self, sample_mt103):
+        """Test generated message contains blocks, key fields and the comma-formatted amount"""
         message = sample_mt103.generate()
-        assert ':23B:CRED' in message
-
-    def test_generate_contains_charges(self, sample_mt103):
-        """Test generated message contains charges"""
-        message = sample_mt103.generate()
-        assert ':71A:SHA' in message
-
-    def test_generate_contains_blocks(self, sample_mt103):
-        """Test generated message contains all blocks"""
-        message = sample_mt103.generate()
-        assert '{1:' in message  # Block 1
-        assert '{2:' in message  # Block 2
-        assert '{3:' in message  # Block 3
-        assert '{4:' in message  # Block 4
-        assert '{5:' in message  # Block 5
-
-    def test_generate_amount_format(self, sample_mt103):
-        """Test amount is formatted with comma decimal separator"""
-        message = sample_mt103.generate()
-        # Amount should be 5000,00 (European format)
-        assert '5000,00' in message
-
+        assert set(EXPECTED_TOKENS) - set(_TOKENS_RE.findall(message)) == set()
+
+    def test_generate_remittance_limited_to_four_lines(self, sample_mt103):
+        """Test that :70: keeps at most 4 lines of 35 characters"""
+        message = replace(sample_mt103, remittance_info='X' * 200).generate()
+        field_70 = message.split(':70:')[1].split('\n:71A:')[0]
+        assert field_70.split('\n') == ['X' * 35] * 4
+
+    def test_generate_optional_fields(self, sample_mt103):
+        """Test optional fields :23E:, :33B: and :72: are placed in order"""
+        message = replace(
+            sample_mt103,
+            instruction_code='SDVA',
+            instructed_amount=5100.00,
+            sender_to_receiver_info='/ACC/' + 'Y' * 40,
+        ).generate()
+        lines = message.split('\n')
+        assert lines.index(':23E:SDVA') == lines.index(':23B:CRED') + 1
+        assert lines.index(':33B:EUR5100,00') == lines.index(':32A:260214EUR5000,00') + 1
+        assert lines[lines.index(':71A:SHA') + 1:lines.index('-}')] == [':72:/ACC/' + 'Y' * 30, 'Y' * 10]
+
+    def test_build_formatter_cached_per_mask(self):
+        """Test one template is built per combination of optional fields"""
+        formatter = MT103Message.build_formatter((False, False, False))
+        assert MT103Message.build_formatter((False, False, False)) is formatter
+        assert ':23E:' not in formatter.template
+        assert ':23E:' in MT103Message.build_formatter((True, False, False)).template
 
 class TestConstants:
     """Test cases for module constants"""
 
-    def test_bank_operation_codes(self):
-        """Test bank operation codes are defined"""
-        assert 'CRED' in BANK_OPERATION_CODES
-        assert 'SPAY' in BANK_OPERATION_CODES
-
-    def test_charge_types(self):
-        """Test charge types are defined"""
-        assert 'SHA' in CHARGE_TYPES
-        assert 'OUR' in CHARGE_TYPES
-        assert 'BEN' in CHARGE_TYPES
+    @pytest.mark.parametrize('constants,code', [
+        (BANK_OPERATION_CODES, 'CRED'),
+        (BANK_OPERATION_CODES, 'SPAY'),
+        (CHARGE_TYPES, 'SHA'),
+        (CHARGE_TYPES, 'OUR'),
+        (CHARGE_TYPES, 'BEN'),
+    ])
+    def test_constants_define_code(self, constants, code):
+        """Test bank operation codes and charge types are defined"""
+        assert code in constants